@@ -3,19 +3,13 @@ app.py — Vedabase Notes Agent UI
 ---------------------------------
 Entry point for the Streamlit web interface.
 
-Run with:
+Run with (after `pip install -e .` so the package is importable):
     streamlit run app.py
 
 Or use the CLI shortcut:
     python -m vedabase_notes_agent.cli ui
 """
 
-import sys
-from pathlib import Path
-
-# Add src/ to Python path so all our modules are importable
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 import streamlit as st
 
 st.set_page_config(
@@ -25,6 +19,13 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+# Start loading the embedding model in the background (once per session)
+# so it's warm by the time the user reaches indexing or search.
+if "model_preloaded" not in st.session_state:
+    st.session_state["model_preloaded"] = True
+    from vedabase_notes_agent.index.embed import preload_model_in_background
+    preload_model_in_background()
+
 # ── Home page ─────────────────────────────────────────────────────────────────
 
 st.title("📖 Vedabase Notes Agent")
@@ -66,26 +67,21 @@ st.divider()
 # Quick status check on the sidebar
 st.sidebar.markdown("### 📊 System Status")
 
-from vedabase_notes_agent.config import RAW_DIR, CLEAN_DIR, CHUNKS_DIR
+from vedabase_notes_agent.ui_cache import (
+    cached_collection_size, pipeline_status, status_markdown
+)
 
-raw_ok    = (RAW_DIR    / "noi" / "noi_raw.json").exists()
-clean_ok  = (CLEAN_DIR  / "noi_clean.jsonl").exists()
-chunks_ok = (CHUNKS_DIR / "noi_chunks.jsonl").exists()
+status = pipeline_status()
+raw_ok, clean_ok, chunks_ok = status
 
 try:
-    from vedabase_notes_agent.index.vector_store import collection_size
-    db_size = collection_size()
+    db_size = cached_collection_size()
     db_ok = db_size > 0
 except Exception:
     db_ok   = False
     db_size = 0
 
-st.sidebar.markdown(
-    f"{'✅' if raw_ok    else '⬜'} Raw data\n\n"
-    f"{'✅' if clean_ok  else '⬜'} Parsed records\n\n"
-    f"{'✅' if chunks_ok else '⬜'} Chunks\n\n"
-    f"{'✅' if db_ok     else '⬜'} Vector DB ({db_size} chunks)"
-)
+st.sidebar.markdown(status_markdown(status, db_ok, db_size))
 
 if not (raw_ok and clean_ok and chunks_ok and db_ok):
     st.sidebar.warning("⚙️ Pipeline not complete — go to **Pipeline** page first.")
@@ -5,12 +5,11 @@ Each step must be completed in order before generating notes.
 Steps only need to be run once (data persists in data/ folder).
 """
 
-import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import streamlit as st
 from vedabase_notes_agent.config import RAW_DIR, CLEAN_DIR, CHUNKS_DIR
+from vedabase_notes_agent.ui_cache import cached_collection_size, cached_retrieve, pipeline_status
 
 st.set_page_config(page_title="Pipeline — Vedabase Notes", page_icon="⚙️", layout="wide")
 st.title("⚙️ Pipeline Setup")
@@ -26,19 +25,44 @@ def status_badge(ok: bool, ok_label: str, fail_label: str) -> str:
     return f"✅ {ok_label}" if ok else f"⬜ {fail_label}"
 
 
+# ── Helper: parsed records preview ────────────────────────────────────────────
+
+@st.cache_data(show_spinner=False)
+def parse_preview(path_str: str, mtime: float):
+    """
+    Table of parsed records (id, verse, first 80 chars of translation).
+
+    Cached per (path, mtime): re-rendering the page reuses the same table,
+    and re-running Step 2 writes a new file with a new mtime.
+    """
+    # pandas parses the JSONL in C and slices the column in one go
+    import pandas as pd
+    df = pd.read_json(path_str, lines=True, dtype=False)
+    if df.empty:
+        return df
+
+    translation = df["translation"].fillna("")
+    preview     = translation.str.slice(0, 80)
+    df["translation_preview"] = preview.where(translation.str.len() <= 80, preview + "...")
+    return df[["id", "verse_number", "translation_preview"]].rename(
+        columns={"verse_number": "verse"}
+    )
+
+
 # ── Check current state ───────────────────────────────────────────────────────
 
 raw_path    = RAW_DIR    / "noi" / "noi_raw.json"
 clean_path  = CLEAN_DIR  / "noi_clean.jsonl"
 chunks_path = CHUNKS_DIR / "noi_chunks.jsonl"
 
-raw_ok    = raw_path.exists()
-clean_ok  = clean_path.exists()
-chunks_ok = chunks_path.exists()
+raw_ok, clean_ok, chunks_ok = pipeline_status()
+
+# Shown in the Step 1 card — worked out once, reusing raw_ok instead of another exists()
+cwd     = Path.cwd()
+raw_rel = raw_path.relative_to(cwd) if raw_ok and raw_path.is_relative_to(cwd) else raw_path
 
 try:
-    from vedabase_notes_agent.index.vector_store import collection_size
-    db_size = collection_size()
+    db_size = cached_collection_size()
     db_ok   = db_size > 0
 except Exception:
     db_ok   = False
@@ -75,7 +99,7 @@ run1 = step_card(
     1, "Ingest",
     "Fetches all 12 pages from vedabase.io using the existing noi-search scraper.",
     raw_ok,
-    f"Data saved at `{raw_path.relative_to(Path.cwd()) if raw_path.exists() else raw_path}`",
+    f"Data saved at `{raw_rel}`",
     "Raw data not found. Click **Run** to fetch from vedabase.io.",
 )
 
@@ -87,6 +111,7 @@ if run1:
             result = ingest_noi()
             st.write(f"Saved to: `{result}`")
             status.update(label="Ingest complete!", state="complete")
+            pipeline_status.clear()
             st.rerun()
         except Exception as e:
             status.update(label="Ingest failed", state="error")
@@ -112,29 +137,26 @@ if run2:
                 from vedabase_notes_agent.parse.parse_noi import parse_noi
                 result = parse_noi()
 
-                # Show a preview of parsed records
-                import json
-                records = []
-                with open(result) as f:
-                    for line in f:
-                        if line.strip():
-                            records.append(json.loads(line))
-
-                st.write(f"Parsed **{len(records)} records**")
-                if records:
-                    st.dataframe(
-                        [{"id": r["id"], "verse": r["verse_number"],
-                          "translation_preview": r["translation"][:80] + "..."
-                          if len(r.get("translation","")) > 80 else r.get("translation","")}
-                         for r in records],
-                        use_container_width=True,
-                    )
+                # Show a preview of parsed records (also warms the cache
+                # for the preview below the card after the rerun)
+                preview = parse_preview(str(result), result.stat().st_mtime)
+                st.write(f"Parsed **{len(preview)} records**")
+                if not preview.empty:
+                    st.dataframe(preview, use_container_width=True)
                 status.update(label="Parse complete!", state="complete")
+                pipeline_status.clear()
                 st.rerun()
             except Exception as e:
                 status.update(label="Parse failed", state="error")
                 st.error(str(e))
 
+elif clean_ok:
+    with st.expander("Preview parsed records"):
+        st.dataframe(
+            parse_preview(str(clean_path), clean_path.stat().st_mtime),
+            use_container_width=True,
+        )
+
 
 # ── Step 3: Chunk ─────────────────────────────────────────────────────────────
 
@@ -155,6 +177,7 @@ if run3:
                 from vedabase_notes_agent.chunk.chunk_text import chunk_noi
                 result = chunk_noi()
                 status.update(label="Chunk complete!", state="complete")
+                pipeline_status.clear()
                 st.rerun()
             except Exception as e:
                 status.update(label="Chunk failed", state="error")
@@ -178,18 +201,18 @@ if run4:
     else:
         with st.status("Embedding chunks and building vector index...", expanded=True) as status:
             try:
-                from vedabase_notes_agent.chunk.chunk_text import load_chunks
+                from vedabase_notes_agent.chunk.chunk_text import iter_chunks
                 from vedabase_notes_agent.index.vector_store import index_chunks, collection_size
 
-                st.write("Loading chunks...")
-                all_chunks = load_chunks()
-                st.write(f"Loaded **{len(all_chunks)} chunks**. Embedding now (this may take a minute)...")
-
-                index_chunks(all_chunks)
+                st.write("Embedding chunks in batches (this may take a minute)...")
+                indexed = index_chunks(iter_chunks())
+                st.write(f"Embedded **{indexed} chunks**.")
                 final_size = collection_size()
 
                 st.write(f"✅ {final_size} chunks now in vector DB")
                 status.update(label=f"Index complete! ({final_size} chunks)", state="complete")
+                cached_collection_size.clear()
+                cached_retrieve.clear()
                 st.rerun()
             except Exception as e:
                 status.update(label="Index failed", state="error")
@@ -208,35 +231,19 @@ if all_done:
         icon="✅",
     )
 else:
-    if st.button("▶ Run All Incomplete Steps", type="primary", use_container_width=True):
-        with st.status("Running full pipeline...", expanded=True) as status:
-            try:
-                if not raw_ok:
-                    st.write("Step 1: Ingesting...")
-                    from vedabase_notes_agent.ingest.ingest_noi import ingest_noi
-                    ingest_noi()
-
-                if not clean_ok:
-                    st.write("Step 2: Parsing...")
-                    from vedabase_notes_agent.parse.parse_noi import parse_noi
-                    parse_noi()
-
-                if not chunks_ok:
-                    st.write("Step 3: Chunking...")
-                    from vedabase_notes_agent.chunk.chunk_text import chunk_noi
-                    chunk_noi()
-
-                st.write("Step 4: Indexing (this takes a moment)...")
-                from vedabase_notes_agent.chunk.chunk_text import load_chunks
-                from vedabase_notes_agent.index.vector_store import index_chunks, collection_size
-                index_chunks(load_chunks())
-                n = collection_size()
-
-                status.update(label=f"Pipeline complete! {n} chunks indexed.", state="complete")
-                st.rerun()
-            except Exception as e:
-                status.update(label="Pipeline failed", state="error")
-                st.error(str(e))
+    from vedabase_notes_agent.jobs import has_running_jobs, start_pipeline_job
+
+    if has_running_jobs(kind="pipeline"):
+        st.info(
+            "⏳ The pipeline is running in the background — the sidebar shows "
+            "progress, and this page refreshes when it finishes.",
+            icon="🔄",
+        )
+    elif st.button("▶ Run All Incomplete Steps", type="primary", use_container_width=True):
+        # Runs ingest → parse → chunk → index on a background thread so this
+        # page (and every other page) stays usable while it works.
+        start_pipeline_job()
+        st.rerun()
 
 # ── Background jobs sidebar ─────────────────────────────────────────────────
 from vedabase_notes_agent.ui_jobs import show_jobs_sidebar
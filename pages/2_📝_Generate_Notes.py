@@ -8,12 +8,10 @@ The sidebar on every page shows live job status.
 
 from __future__ import annotations
 
-import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import streamlit as st
-from vedabase_notes_agent.config import CLAUDE_API_KEY
+from vedabase_notes_agent.config import CLAUDE_API_KEY, OUT_DIR
 
 st.set_page_config(page_title="Generate Notes — Vedabase", page_icon="📝", layout="wide")
 st.title("📝 Generate Notes")
@@ -27,8 +25,8 @@ st.divider()
 # ── Guard: pipeline ready? ────────────────────────────────────────────────────
 
 try:
-    from vedabase_notes_agent.index.vector_store import collection_size
-    pipeline_ready = collection_size() > 0
+    from vedabase_notes_agent.ui_cache import cached_collection_size
+    pipeline_ready = cached_collection_size() > 0
 except Exception:
     pipeline_ready = False
 
@@ -94,17 +92,37 @@ st.divider()
 st.subheader("Recent Jobs")
 
 from vedabase_notes_agent.jobs import get_all_jobs, clear_job
+from vedabase_notes_agent.ui_cache import file_names, read_note
 
-jobs = get_all_jobs()
+# Pipeline jobs also live in the queue — only list note-generation jobs here
+jobs = [j for j in get_all_jobs() if j.get("kind", "notes") == "notes"]
 if not jobs:
     st.caption("No jobs yet. Generate your first notes above!")
 else:
+    # One listing of data/outputs/ instead of two exists() checks per job
+    saved_names = file_names(OUT_DIR)
+    out_dir     = OUT_DIR.resolve()
+
     for job in jobs[:10]:
-        status     = job["status"]
-        topic_text = job.get("topic", "")
-        job_id     = job["job_id"]
+        status      = job["status"]
+        topic_text  = job.get("topic", "")
+        job_id      = job["job_id"]
+        result_path = job.get("result_path") or ""
         icon = {"running": "⏳", "done": "✅", "error": "❌"}.get(status, "❓")
 
+        # Read the saved notes once — shared by the preview and the download
+        content = None
+        note = Path(result_path)
+        if (
+            status == "done" and result_path
+            and note.name in saved_names
+            and note.parent.resolve() == out_dir  # same name elsewhere doesn't count
+        ):
+            try:
+                content = read_note(result_path, note.stat().st_mtime)
+            except FileNotFoundError:
+                pass  # deleted since the folder was listed
+
         with st.container(border=True):
             col_info, col_action = st.columns([5, 1])
 
@@ -121,11 +139,10 @@ else:
                     st.progress(0.0, text="Generating... (20-60 seconds)")
 
                 elif status == "done":
-                    result_path = job.get("result_path", "")
                     st.caption(f"Saved: `{result_path}`")
-                    if result_path and Path(result_path).exists():
+                    if content is not None:
                         with st.expander("Preview notes"):
-                            st.markdown(Path(result_path).read_text(encoding="utf-8"))
+                            st.markdown(content)
 
                 elif status == "error":
                     st.error(job.get("error", "Unknown error"))
@@ -136,17 +153,15 @@ else:
                     if st.button("✕ Clear", key=f"clear_{job_id}", use_container_width=True):
                         clear_job(job_id)
                         st.rerun()
-                if status == "done":
-                    result_path = job.get("result_path", "")
-                    if result_path and Path(result_path).exists():
-                        st.download_button(
-                            "⬇ Download",
-                            data=Path(result_path).read_text(encoding="utf-8"),
-                            file_name=Path(result_path).name,
-                            mime="text/markdown",
-                            key=f"dl_{job_id}",
-                            use_container_width=True,
-                        )
+                if content is not None:
+                    st.download_button(
+                        "⬇ Download",
+                        data=content,
+                        file_name=Path(result_path).name,
+                        mime="text/markdown",
+                        key=f"dl_{job_id}",
+                        use_container_width=True,
+                    )
 
 # ── Sidebar jobs widget ───────────────────────────────────────────────────────
 
@@ -5,12 +5,13 @@ Uses semantic search (same as the agent uses internally) so plain English
 queries match Sanskrit terms with diacritics.
 """
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
+import orjson
 import streamlit as st
 from vedabase_notes_agent.config import CLEAN_DIR
+from vedabase_notes_agent.ui_browse import (
+    QUICK_SEARCHES, VERSE_OPTIONS, highlight, hit_card, normalize
+)
+from vedabase_notes_agent.ui_cache import cached_collection_size, cached_retrieve
 
 st.set_page_config(page_title="Browse Book — Vedabase", page_icon="🔍", layout="wide")
 st.title("🔍 Browse the Book")
@@ -23,8 +24,7 @@ st.divider()
 # ── Check if vector DB is ready ───────────────────────────────────────────────
 
 try:
-    from vedabase_notes_agent.index.vector_store import collection_size
-    db_ready = collection_size() > 0
+    db_ready = cached_collection_size() > 0
 except Exception:
     db_ready = False
 
@@ -44,28 +44,44 @@ with col_k:
 
 # ── Filter by verse ───────────────────────────────────────────────────────────
 
-verse_options = ["All"] + ["Preface"] + [f"Text {i}" for i in range(1, 12)]
-filter_verse  = st.pills("Filter by text", verse_options, default="All")
+filter_verse = st.pills("Filter by text", VERSE_OPTIONS, default="All")
 
 st.divider()
 
 # ── Search execution ──────────────────────────────────────────────────────────
 
-def normalize(s: str) -> str:
-    """Strip diacritics so plain English matches Sanskrit."""
-    import unicodedata
-    return unicodedata.normalize("NFD", s).encode("ascii", "ignore").decode()
+@st.cache_data(show_spinner=False)
+def load_clean_records(path_str: str, mtime: float) -> list[dict]:
+    """
+    Parsed verse records for the table of contents.
+
+    Cached per (path, mtime) so reruns don't re-read the file; re-running
+    the Parse step changes the mtime and refreshes it. orjson parses the
+    raw bytes directly, skipping the text decode.
+    """
+    with open(path_str, "rb") as f:
+        return [orjson.loads(line) for line in f if line.strip()]
 
 
 if query.strip():
     if not db_ready:
         st.warning("Vector DB not indexed yet. Run the **⚙️ Pipeline** steps first.", icon="⚠️")
+        # The DB size is cached for 30s — indexed from the CLI just now? Check again.
+        if st.button("🔄 Check again"):
+            cached_collection_size.clear()
+            cached_retrieve.clear()
+            st.rerun()
         st.stop()
 
     try:
-        from vedabase_notes_agent.retrieve.retriever import retrieve
-
-        hits = retrieve(query.strip(), top_k=top_k)
+        # Cached per normalized query — changing the verse filter below
+        # (or any other rerun) doesn't search again. Same normalization as
+        # retrieve() itself, so Browse and the notes agent get the same hits.
+        # The index version in the key makes a re-index (even from the CLI)
+        # search again instead of showing old results.
+        from vedabase_notes_agent.index.vector_store import index_version
+        from vedabase_notes_agent.retrieve.retriever import normalize_query
+        hits = cached_retrieve(normalize_query(query), top_k, index_version())
 
         # Apply verse filter
         if filter_verse != "All":
@@ -77,6 +93,10 @@ if query.strip():
         else:
             st.caption(f"{len(hits)} result(s) for **\"{query}\"**")
 
+            # Normalized query words to highlight — worked out once, not per hit
+            qwords = {w for w in normalize(query.lower()).split() if len(w) > 2}
+
+            cards = []
             for hit in hits:
                 verse   = hit["verse_number"]
                 section = hit["section"].capitalize()
@@ -89,40 +109,22 @@ if query.strip():
                 else:
                     label = f"NOI Text {verse}"
 
-                with st.container(border=True):
-                    hcol1, hcol2 = st.columns([4, 1])
-                    with hcol1:
-                        st.markdown(f"**{label}** — *{section}*")
-                    with hcol2:
-                        st.link_button("Read on vedabase.io ↗", uri, use_container_width=True)
-
-                    # Highlight query words in the snippet
-                    query_words = normalize(query.lower()).split()
-                    highlighted = text
-                    for word in query_words:
-                        if len(word) > 2:
-                            # Find and wrap matching words (diacritic-insensitive)
-                            import re
-                            def highlight_match(m):
-                                return f"**{m.group(0)}**"
-                            pattern = re.compile(
-                                r'\b\w*' + re.escape(word) + r'\w*\b', re.IGNORECASE
-                            )
-                            # Apply on normalized version to find positions, show original
-                            words_list = highlighted.split()
-                            result_words = []
-                            for w in words_list:
-                                if word in normalize(w.lower()):
-                                    result_words.append(f"**{w}**")
-                                else:
-                                    result_words.append(w)
-                            highlighted = " ".join(result_words)
-
-                    st.markdown(highlighted[:800] + ("..." if len(text) > 800 else ""))
-
-                    # Relevance score
-                    score = 1 - hit.get("distance", 0.5)
-                    st.caption(f"Relevance: {score:.0%}")
+                # Highlight query words in the snippet (diacritic-insensitive).
+                # Cut to 800 chars first so only the shown part is scanned
+                # and a ** marker is never cut in half.
+                snippet = text[:800]
+                if qwords:
+                    snippet = highlight(snippet, qwords)
+                if len(text) > 800:
+                    snippet += "..."
+
+                # Relevance score
+                score = 1 - hit.get("distance", 0.5)
+
+                cards.append(hit_card(label, section, uri, snippet, score))
+
+            # All result cards in one element instead of ~6 widgets per hit
+            st.markdown("\n\n".join(cards), unsafe_allow_html=True)
 
     except Exception as e:
         st.error(f"Search error: {e}")
@@ -133,12 +135,7 @@ else:
 
     clean_path = CLEAN_DIR / "noi_clean.jsonl"
     if clean_path.exists():
-        import json
-        records = []
-        with open(clean_path) as f:
-            for line in f:
-                if line.strip():
-                    records.append(json.loads(line))
+        records = load_clean_records(str(clean_path), clean_path.stat().st_mtime)
 
         for rec in records:
             with st.expander(
@@ -189,14 +186,7 @@ with st.sidebar:
 """)
     st.divider()
     st.markdown("### Quick Searches")
-    quick = [
-        "controlling the senses",
-        "qualities of a spiritual master",
-        "chanting the holy name",
-        "Vrindavana dhama",
-        "offenses to be avoided",
-    ]
-    for q in quick:
+    for q in QUICK_SEARCHES:
         if st.button(q, key=f"quick_{q}", use_container_width=True):
             st.query_params["q"] = q
             st.rerun()
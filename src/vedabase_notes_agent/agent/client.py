@@ -0,0 +1,26 @@
+"""
+client.py
+---------
+One shared Anthropic client for the whole process.
+
+Beginner tip — why share the client?
+  The client keeps a pool of open HTTPS connections to the API. Creating
+  a new client for every call means a fresh TCP + TLS handshake each
+  time (often 100-300 ms). Reusing one client lets the plan, draft, and
+  verify calls — and later note jobs — reuse warm connections.
+"""
+
+from functools import lru_cache
+
+import anthropic
+
+from vedabase_notes_agent.config import CLAUDE_API_KEY
+
+
+@lru_cache(maxsize=1)
+def get_claude_client() -> anthropic.Anthropic:
+    """
+    Return the process-wide Anthropic client, creating it on first use.
+    The client is thread-safe, so background jobs can share it.
+    """
+    return anthropic.Anthropic(api_key=CLAUDE_API_KEY, max_retries=2)
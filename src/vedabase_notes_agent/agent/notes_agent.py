@@ -17,20 +17,23 @@ Beginner tip — what is an "agent loop"?
   steps if something fails.
 """
 
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
 import anthropic
-from rich.console import Console
-from rich.progress import track
 
 from vedabase_notes_agent.config import (
     CLAUDE_API_KEY, CLAUDE_MODEL, EXCERPT_MAX_CHARS, MAX_TOKENS, TOP_K
 )
 from vedabase_notes_agent.retrieve.retriever import retrieve, format_context
 from vedabase_notes_agent.agent.prompts import (
-    SYSTEM_PROMPT, PLAN_PROMPT, DRAFT_PROMPT
+    SYSTEM_PROMPT, context_block, draft, plan
 )
+from vedabase_notes_agent.agent.client import get_claude_client
 from vedabase_notes_agent.agent.verifier import rule_check, llm_check
-
-console = Console()
+from vedabase_notes_agent.console import get_console
 
 
 def generate_notes(
@@ -38,6 +41,7 @@ def generate_notes(
     audience: str = "general devotees",
     duration: int = 60,
     style:    str = "class",
+    on_token: Callable[[str], None] | None = None,
 ) -> str:
     """
     Full agent pipeline. Returns the generated notes as a markdown string.
@@ -47,6 +51,9 @@ def generate_notes(
         audience: Who the notes are for (e.g. "new students", "experienced devotees")
         duration: How long the class/discourse will be (minutes)
         style:    "class" (structured teaching) or "discourse" (flowing talk)
+        on_token: Optional callback, called with each piece of the draft text
+                  as Claude streams it (e.g. to print it live). The outline is
+                  not streamed — it appears again inside the draft.
     """
     if not CLAUDE_API_KEY:
         raise ValueError(
@@ -54,10 +61,10 @@ def generate_notes(
             "Get a key at: https://console.anthropic.com"
         )
 
-    client = anthropic.Anthropic(api_key=CLAUDE_API_KEY)
+    client = get_claude_client()
 
     # ── Step (a): Retrieve relevant chunks ───────────────────────────────────
-    console.print(f"\n[cyan]Step 1/4:[/] Retrieving relevant passages for: [bold]{topic}[/]")
+    get_console().print(f"\n[cyan]Step 1/4:[/] Retrieving relevant passages for: [bold]{topic}[/]")
     hits = retrieve(topic, top_k=TOP_K)
 
     if not hits:
@@ -67,61 +74,69 @@ def generate_notes(
         )
 
     context = format_context(hits)
-    console.print(f"  Found {len(hits)} relevant passages.")
+    get_console().print(f"  Found {len(hits)} relevant passages.")
 
     # ── Step (b): Plan an outline ─────────────────────────────────────────────
-    console.print(f"\n[cyan]Step 2/4:[/] Planning outline...")
+    get_console().print(f"\n[cyan]Step 2/4:[/] Planning outline...")
     outline = _call_claude(
         client,
-        PLAN_PROMPT.format(
+        plan(
             topic=topic,
             audience=audience,
             duration=duration,
             style=style,
-            context=context,
         ),
+        context=context,
     )
-    console.print("[dim]Outline complete.[/]")
+    get_console().print("[dim]Outline complete.[/]")
 
     # ── Step (c): Draft the full notes ────────────────────────────────────────
-    console.print(f"\n[cyan]Step 3/4:[/] Drafting notes...")
+    get_console().print(f"\n[cyan]Step 3/4:[/] Drafting notes...")
     notes = _call_claude(
         client,
-        DRAFT_PROMPT.format(
+        draft(
             topic=topic,
             audience=audience,
             duration=duration,
             style=style,
             outline=outline,
-            context=context,
             excerpt_max=EXCERPT_MAX_CHARS,
         ),
+        context=context,
+        on_token=on_token,
     )
-    console.print("[dim]Draft complete.[/]")
+    if on_token:
+        get_console().print()  # finish the line the streamed draft ended on
+    get_console().print("[dim]Draft complete.[/]")
 
     # ── Step (d): Verify ──────────────────────────────────────────────────────
-    console.print(f"\n[cyan]Step 4/4:[/] Verifying notes quality...")
-
-    # Rule-based check first (fast)
-    rule_result = rule_check(notes)
-    if rule_result["issues"]:
-        console.print(f"[yellow]  Rule check issues:[/]")
-        for issue in rule_result["issues"]:
-            console.print(f"    • {issue}")
-    else:
-        console.print(
-            f"  [green]Rule check passed.[/] "
-            f"({rule_result['citation_count']} citations found)"
-        )
+    get_console().print(f"\n[cyan]Step 4/4:[/] Verifying notes quality...")
+
+    # The LLM check is a slow network call — start it in the background
+    # and run the fast rule-based check while waiting for Claude's answer
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        llm_future = pool.submit(llm_check, notes)
+
+        rule_result = rule_check(notes)
+        if rule_result["issues"]:
+            get_console().print(f"[yellow]  Rule check issues:[/]")
+            for issue in rule_result["issues"]:
+                get_console().print(f"    • {issue}")
+        else:
+            get_console().print(
+                f"  [green]Rule check passed.[/] "
+                f"({rule_result['citation_count']} citations found)"
+            )
+
+        # LLM-based check (more thorough)
+        llm_result = llm_future.result()
 
-    # LLM-based check (more thorough)
-    llm_result = llm_check(notes)
     if not llm_result.get("pass", True):
-        console.print("[yellow]  LLM check issues:[/]")
+        get_console().print("[yellow]  LLM check issues:[/]")
         for issue in llm_result.get("issues", []):
-            console.print(f"    • {issue}")
+            get_console().print(f"    • {issue}")
     else:
-        console.print("  [green]LLM check passed.[/]")
+        get_console().print("  [green]LLM check passed.[/]")
 
     # Attach a verification summary footer to the notes
     notes += _verification_footer(rule_result, llm_result)
@@ -129,20 +144,51 @@ def generate_notes(
     return notes
 
 
-def _call_claude(client: anthropic.Anthropic, prompt: str) -> str:
+def _call_claude(
+    client:  anthropic.Anthropic,
+    prompt:  str,
+    context: str | None = None,
+    on_token: Callable[[str], None] | None = None,
+) -> str:
     """
     Send a prompt to Claude and return the response text.
 
     This is a thin wrapper around the Anthropic API that handles
-    the message format and extracts the text response.
+    the message format and collects the text response.
+
+    The response is streamed: text arrives piece by piece, and each piece
+    is passed to `on_token` (if given) as soon as it arrives, so callers
+    can show progress instead of waiting for the whole answer.
+
+    Beginner tip — prompt caching:
+      When `context` is given, the retrieved passages are sent as a system
+      block marked cache_control="ephemeral". The plan and draft calls send
+      the exact same system blocks, so the second call reuses the cached
+      prefix — faster and cheaper than re-reading the passages.
     """
-    response = client.messages.create(
+    system = SYSTEM_PROMPT
+    if context is not None:
+        system = [
+            {"type": "text", "text": SYSTEM_PROMPT},
+            {
+                "type":          "text",
+                "text":          context_block(context=context),
+                "cache_control": {"type": "ephemeral"},
+            },
+        ]
+
+    parts = []
+    with client.messages.stream(
         model=CLAUDE_MODEL,
         max_tokens=MAX_TOKENS,
-        system=SYSTEM_PROMPT,
+        system=system,
         messages=[{"role": "user", "content": prompt}],
-    )
-    return response.content[0].text.strip()
+    ) as stream:
+        for text in stream.text_stream:
+            parts.append(text)
+            if on_token:
+                on_token(text)
+    return "".join(parts).strip()
 
 
 def _verification_footer(rule_result: dict, llm_result: dict) -> str:
@@ -6,8 +6,15 @@ All prompt templates used by the agent.
 Keeping prompts in one file makes them easy to tune without
 touching the agent logic. Think of this as the "script" for
 the AI — what instructions we give Claude at each step.
+
+Each template is also "compiled" once at import time into a small
+function (plan, draft, verify, context_block) that fills in the
+{placeholders} without re-scanning the template on every call.
 """
 
+from collections.abc import Callable
+from string import Formatter
+
 
 # ── System prompt ─────────────────────────────────────────────────────────────
 
@@ -38,18 +45,28 @@ Citation format rules:
 """
 
 
+# ── Shared context (sent once, cached by the API) ────────────────────────────
+# The plan and draft steps both need the same retrieved passages. They are
+# sent as a cached system block instead of being pasted into each prompt,
+# so the second call reuses them instead of processing them again.
+
+CONTEXT_PROMPT = """\
+Retrieved passages from the Nectar of Instruction (these are your PRIMARY
+source — cite everything from here):
+
+{context}
+"""
+
+
 # ── Step (a): Plan an outline ─────────────────────────────────────────────────
 
 PLAN_PROMPT = """\
-Based on the following retrieved passages from the Nectar of Instruction,
+Based on the retrieved passages from the Nectar of Instruction,
 create a structured outline for a {style} on the topic: "{topic}"
 
 Audience: {audience}
 Duration: {duration} minutes
 
-Retrieved passages:
-{context}
-
 Produce a numbered outline with 3-6 main sections and estimated time per section.
 Include one section for stories/pastimes and one for practical application.
 Each section should note which source (NOI verse or other book) will support it.
@@ -69,8 +86,7 @@ Duration: {duration} minutes
 Outline:
 {outline}
 
-Retrieved NOI passages (these are your PRIMARY source — cite everything from here):
-{context}
+The retrieved NOI passages are your PRIMARY source — cite everything from them.
 
 You may ALSO use your knowledge of other Śrīla Prabhupāda books
 (BG, SB, CC, NOD, etc.) to add SUPPLEMENTAL supporting references.
@@ -172,3 +188,32 @@ Respond with this exact JSON:
 Notes to verify:
 {notes}
 """
+
+
+# ── Compiled templates ───────────────────────────────────────────────────────
+
+def _compile(template: str) -> Callable[..., str]:
+    """
+    Split a str.format template into literal text and field names once,
+    and return a function that joins them with the given values.
+
+    render(**kw) gives the same result as template.format(**kw) for the
+    plain {name} fields (and {{ }} escapes) used in this file.
+    """
+    pieces = [(literal, field) for literal, field, _, _ in Formatter().parse(template)]
+
+    def render(**values) -> str:
+        out = []
+        for literal, field in pieces:
+            out.append(literal)
+            if field is not None:
+                out.append(str(values[field]))
+        return "".join(out)
+
+    return render
+
+
+context_block = _compile(CONTEXT_PROMPT)
+plan          = _compile(PLAN_PROMPT)
+draft         = _compile(DRAFT_PROMPT)
+verify        = _compile(VERIFY_PROMPT)
@@ -20,16 +20,16 @@ Two levels of verification:
      - Returns structured JSON with pass/fail + issues
 """
 
-import json
 import re
 
-import anthropic
+import orjson
 
 from vedabase_notes_agent.config import CLAUDE_API_KEY, CLAUDE_MODEL, EXCERPT_MAX_CHARS
-from vedabase_notes_agent.agent.prompts import VERIFY_PROMPT, SYSTEM_PROMPT
+from vedabase_notes_agent.agent.client import get_claude_client
+from vedabase_notes_agent.agent.prompts import SYSTEM_PROMPT, verify
 
 # Sections that MUST appear in valid notes
-REQUIRED_SECTIONS = [
+REQUIRED_SECTIONS = (
     "## Outline",
     "## Detailed Notes",
     "## Stories & Pastimes",
@@ -37,10 +37,16 @@ REQUIRED_SECTIONS = [
     "## Practical Applications",
     "## Discussion Prompts",
     "## Appendix",
-]
+)
 
-# Regex to find citations like [NOI 1 Translation] or [NOI Preface]
-CITATION_RE = re.compile(r"\[NOI\s+\w+\s+\w+\]|\[NOI\s+Preface\]", re.IGNORECASE)
+# Regexes are compiled once here, not on every rule_check() / llm_check() call.
+
+# Regex to find citations like [NOI 1 Translation] or [NOI Preface].
+# The shared "[NOI " prefix is matched once; only the tail branches.
+CITATION_RE = re.compile(r"\[NOI\s+(?:\w+\s+\w+|Preface)\]", re.IGNORECASE)
+
+# Quoted appendix excerpts: > "..."
+EXCERPT_RE = re.compile(r'>\s*"([^"]+)"')
 
 
 def rule_check(notes: str) -> dict:
@@ -51,33 +57,48 @@ def rule_check(notes: str) -> dict:
     """
     issues = []
 
-    # Check 1: All required sections present
-    missing_sections = [s for s in REQUIRED_SECTIONS if s not in notes]
+    # Check 1: All required sections present.
+    # One pass over the lines; a heading counts if it starts with a required
+    # section name ("## Appendix: Key NOI Passages" → "## Appendix").
+    seen = {
+        section
+        for line in notes.splitlines() if line.startswith(REQUIRED_SECTIONS)
+        for section in REQUIRED_SECTIONS if line.startswith(section)
+    }
+    missing_sections = [s for s in REQUIRED_SECTIONS if s not in seen]
     if missing_sections:
         issues.append(f"Missing sections: {missing_sections}")
 
+    # Citations and excerpts are scanned separately: an excerpt the model
+    # forgot to close (or closed with a curly quote) runs on to the next ",
+    # and in a combined pass it would swallow the citations in between.
+    citation_count = len(CITATION_RE.findall(notes))
+
+    # Quoted passages between > " and " that are too long. The length comes
+    # from the match offsets — no need to copy the excerpt text.
+    long_excerpts = sum(
+        1 for m in EXCERPT_RE.finditer(notes)
+        if m.end(1) - m.start(1) > EXCERPT_MAX_CHARS
+    )
+
     # Check 2: At least some citations exist
-    citations = CITATION_RE.findall(notes)
-    if len(citations) < 3:
+    if citation_count < 3:
         issues.append(
-            f"Too few citations ({len(citations)} found — expected at least 3). "
+            f"Too few citations ({citation_count} found — expected at least 3). "
             "Every key point should have a citation."
         )
 
     # Check 3: Appendix excerpts not too long
-    # Find quoted passages between > " and " —
-    excerpts = re.findall(r'>\s*"([^"]+)"', notes)
-    long_excerpts = [e for e in excerpts if len(e) > EXCERPT_MAX_CHARS]
     if long_excerpts:
         issues.append(
-            f"{len(long_excerpts)} excerpt(s) exceed {EXCERPT_MAX_CHARS} chars."
+            f"{long_excerpts} excerpt(s) exceed {EXCERPT_MAX_CHARS} chars."
         )
 
     return {
         "sections_ok":    len(missing_sections) == 0,
-        "citations_ok":   len(citations) >= 3,
-        "excerpts_ok":    len(long_excerpts) == 0,
-        "citation_count": len(citations),
+        "citations_ok":   citation_count >= 3,
+        "excerpts_ok":    long_excerpts == 0,
+        "citation_count": citation_count,
         "issues":         issues,
         "pass":           len(issues) == 0,
     }
@@ -93,9 +114,9 @@ def llm_check(notes: str) -> dict:
     if not CLAUDE_API_KEY:
         return {"pass": True, "issues": ["LLM check skipped — no API key"]}
 
-    client = anthropic.Anthropic(api_key=CLAUDE_API_KEY)
+    client = get_claude_client()
 
-    prompt = VERIFY_PROMPT.format(
+    prompt = verify(
         excerpt_max=EXCERPT_MAX_CHARS,
         notes=notes[:8000],  # truncate to avoid token limit
     )
@@ -112,11 +133,14 @@ def llm_check(notes: str) -> dict:
     # Parse the JSON response from Claude
     try:
         # Sometimes Claude wraps JSON in ```json ... ``` — strip that
-        raw = re.sub(r"^```json\s*", "", raw)
-        raw = re.sub(r"\s*```$", "", raw)
-        return json.loads(raw)
-    except json.JSONDecodeError:
+        # (plain string methods: the fence is literal text, no regex needed)
+        # Strip first, so whitespace around the fence can't hide it
+        raw = raw.strip().removeprefix("```json").removeprefix("```")
+        raw = raw.strip().removesuffix("```").strip()
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
         return {
             "pass": False,
             "issues": [f"Could not parse verifier response: {raw[:200]}"],
         }
+
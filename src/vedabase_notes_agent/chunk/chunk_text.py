@@ -31,19 +31,25 @@ Output schema per chunk:
 
 from __future__ import annotations
 
-import json
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
 
-from rich.console import Console
+import orjson
 
 from vedabase_notes_agent.config import CHUNKS_DIR, CLEAN_DIR
-
-console = Console()
+from vedabase_notes_agent.console import get_console
 
 # How many characters before splitting a purport into two chunks
 PURPORT_SPLIT_CHARS = 1200
 # How many characters of overlap between purport chunks (keeps context)
 OVERLAP_CHARS = 200
+# How far a split point may move to land on a space instead of mid-word
+WORD_BOUNDARY_WINDOW = 50
+# Above this many records, chunking is spread over all CPU cores.
+# NOI has ~12 records, so it always takes the simple single-process path.
+PARALLEL_CHUNK_THRESHOLD = 1000
 
 
 def chunk_noi(
@@ -59,26 +65,25 @@ def chunk_noi(
     out_file.parent.mkdir(parents=True, exist_ok=True)
 
     # Load clean records
-    records: list[dict] = []
-    with open(clean_file, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                records.append(json.loads(line))
+    records = _read_jsonl(clean_file)
 
-    console.print(f"[cyan]Chunking {len(records)} records...[/]")
+    get_console().print(f"[cyan]Chunking {len(records)} records...[/]")
 
-    all_chunks: list[dict] = []
-    for record in records:
-        chunks = _chunk_record(record)
-        all_chunks.extend(chunks)
+    if len(records) > PARALLEL_CHUNK_THRESHOLD:
+        # Each record is independent, so worker processes can chunk them in
+        # parallel; chunksize=64 sends records in batches to cut overhead.
+        with ProcessPoolExecutor() as pool:
+            all_chunks = list(chain.from_iterable(
+                pool.map(_chunk_record, records, chunksize=64)
+            ))
+    else:
+        all_chunks = list(chain.from_iterable(map(_chunk_record, records)))
 
-    # Write chunks
-    with open(out_file, "w", encoding="utf-8") as f:
-        for chunk in all_chunks:
-            f.write(json.dumps(chunk, ensure_ascii=False) + "\n")
+    # Write chunks in one call (orjson writes UTF-8 bytes, keeping diacritics as-is)
+    with open(out_file, "wb") as f:
+        f.write(b"".join(orjson.dumps(chunk) + b"\n" for chunk in all_chunks))
 
-    console.print(f"[green]Created {len(all_chunks)} chunks →[/] {out_file}")
+    get_console().print(f"[green]Created {len(all_chunks)} chunks →[/] {out_file}")
     return out_file
 
 
@@ -86,31 +91,41 @@ def _chunk_record(record: dict) -> list[dict]:
     """
     Split one clean record into 1-3 chunks depending on content length.
     """
+    if record["verse_number"] == "preface":
+        return _chunk_preface(record)
+    return _chunk_verse(record)
+
+
+def _make_chunk(record: dict, section: str, text: str, part: int = 0) -> dict:
+    """
+    Build one chunk dict. `text` must already be stripped.
+    """
+    parent   = record["id"]
+    chunk_id = f"{parent}-{section}-{part}" if part > 0 else f"{parent}-{section}"
+    return {
+        "chunk_id":    chunk_id,
+        "parent_id":   parent,
+        "book":        record["book"],
+        "verse_number": record["verse_number"],
+        "section":     section,
+        "text":        text,
+        "source_uri":  record["source_uri"],
+    }
+
+
+def _chunk_preface(record: dict) -> list[dict]:
+    """The preface: one chunk per paragraph, skipping very short fragments."""
+    paragraphs = (p.strip() for p in record["purport"].split("\n\n"))
+    return [
+        _make_chunk(record, "preface", para, i)
+        for i, para in enumerate((p for p in paragraphs if p), 1)
+        if len(para) > 50
+    ]
+
+
+def _chunk_verse(record: dict) -> list[dict]:
+    """A verse: a translation chunk, then one or two purport chunks."""
     chunks: list[dict] = []
-    verse  = record["verse_number"]
-    parent = record["id"]
-    book   = record["book"]
-    uri    = record["source_uri"]
-
-    def make_chunk(section: str, text: str, part: int = 0) -> dict:
-        suffix = f"-{part}" if part > 0 else ""
-        return {
-            "chunk_id":    f"{parent}-{section}{suffix}",
-            "parent_id":   parent,
-            "book":        book,
-            "verse_number": verse,
-            "section":     section,
-            "text":        text.strip(),
-            "source_uri":  uri,
-        }
-
-    # ── Preface: split by paragraph ───────────────────────────────────────────
-    if verse == "preface":
-        paragraphs = [p.strip() for p in record["purport"].split("\n\n") if p.strip()]
-        for i, para in enumerate(paragraphs, 1):
-            if len(para) > 50:  # skip very short fragments
-                chunks.append(make_chunk("preface", para, i))
-        return chunks
 
     # ── Translation chunk ─────────────────────────────────────────────────────
     translation_text = ""
@@ -119,8 +134,9 @@ def _chunk_record(record: dict) -> list[dict]:
     if record.get("translation"):
         translation_text += f"Translation: {record['translation']}"
 
-    if translation_text.strip():
-        chunks.append(make_chunk("translation", translation_text))
+    translation_text = translation_text.strip()
+    if translation_text:
+        chunks.append(_make_chunk(record, "translation", translation_text))
 
     # ── Purport chunk(s) ──────────────────────────────────────────────────────
     purport = record.get("purport", "").strip()
@@ -129,27 +145,58 @@ def _chunk_record(record: dict) -> list[dict]:
 
     if len(purport) <= PURPORT_SPLIT_CHARS:
         # Short enough to keep as one chunk
-        chunks.append(make_chunk("purport", purport))
+        chunks.append(_make_chunk(record, "purport", purport))
     else:
-        # Split into two overlapping chunks
-        mid = len(purport) // 2
-        part1 = purport[: mid + OVERLAP_CHARS]
-        part2 = purport[mid - OVERLAP_CHARS :]
-        chunks.append(make_chunk("purport", part1, part=1))
-        chunks.append(make_chunk("purport", part2, part=2))
+        # Split into two overlapping chunks, cutting between words
+        mid    = len(purport) // 2
+        end1   = _space_before(purport, mid + OVERLAP_CHARS)
+        start2 = _space_before(purport, mid - OVERLAP_CHARS)
+        part1  = purport[:end1].rstrip()
+        part2  = purport[start2:].lstrip()
+        chunks.append(_make_chunk(record, "purport", part1, part=1))
+        chunks.append(_make_chunk(record, "purport", part2, part=2))
 
     return chunks
 
 
-def load_chunks(chunks_file: Path | None = None) -> list[dict]:
+def _space_before(text: str, pos: int) -> int:
+    """
+    The index of the last space at or before `pos` (looking back at most
+    WORD_BOUNDARY_WINDOW chars), so a cut there doesn't split a word.
+    Falls back to `pos` itself if there is no space nearby.
     """
-    Utility: load all chunks from JSONL. Used by the indexer.
+    space = text.rfind(" ", pos - WORD_BOUNDARY_WINDOW, pos + 1)
+    return space if space != -1 else pos
+
+
+def iter_chunks(chunks_file: Path | None = None) -> Iterator[dict]:
+    """
+    Yield chunks from JSONL one at a time. Used by the indexer.
+
+    Reading lazily means only the batch being embedded is held in
+    memory, not the whole book.
     """
     chunks_file = chunks_file or (CHUNKS_DIR / "noi_chunks.jsonl")
-    chunks = []
-    with open(chunks_file, encoding="utf-8") as f:
+    with open(chunks_file, "rb") as f:
         for line in f:
-            line = line.strip()
-            if line:
-                chunks.append(json.loads(line))
-    return chunks
+            if not line.isspace():
+                yield orjson.loads(line)
+
+
+def load_chunks(chunks_file: Path | None = None) -> list[dict]:
+    """
+    Utility: load all chunks from JSONL into a list.
+    """
+    return _read_jsonl(chunks_file or (CHUNKS_DIR / "noi_chunks.jsonl"))
+
+
+def _read_jsonl(path: Path) -> list[dict]:
+    """
+    Read a whole JSONL file in one go and parse every line.
+
+    One read() plus one bytes.splitlines() (both in C) replaces stepping
+    through the file line by line; orjson parses the raw bytes directly.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    return [orjson.loads(line) for line in data.splitlines() if line.strip()]
@@ -20,9 +20,8 @@ Usage examples:
 from pathlib import Path
 
 import click
-from rich.console import Console
 
-console = Console()
+from vedabase_notes_agent.console import get_console
 
 # ── CLI group ─────────────────────────────────────────────────────────────────
 # @click.group() means this file is a collection of subcommands,
@@ -49,14 +48,14 @@ def ingest_noi_cmd(out):
     This wraps the scraper from the noi-search project.
     Set NOI_SCRAPER_PATH in your .env file to point to it.
     """
-    console.print("\n[bold]Step 1 — Ingest NOI[/]")
-    console.print("Reusing existing scraper from noi-search project...\n")
+    get_console().print("\n[bold]Step 1 — Ingest NOI[/]")
+    get_console().print("Reusing existing scraper from noi-search project...\n")
 
     from vedabase_notes_agent.ingest.ingest_noi import ingest_noi
 
     out_path = Path(out) if out else None
     result = ingest_noi(out_dir=out_path)
-    console.print(f"\n[bold green]Done.[/] Raw data saved to: {result}")
+    get_console().print(f"\n[bold green]Done.[/] Raw data saved to: {result}")
 
 
 # ── parse ─────────────────────────────────────────────────────────────────────
@@ -71,10 +70,10 @@ def parse_cmd(book, raw, out):
 
     Extracts: verse number, Sanskrit, translation, purport, source URI.
     """
-    console.print(f"\n[bold]Step 2 — Parse {book}[/]\n")
+    get_console().print(f"\n[bold]Step 2 — Parse {book}[/]\n")
 
     if book.upper() != "NOI":
-        console.print(f"[red]Unknown book: {book}. Only NOI is supported.[/]")
+        get_console().print(f"[red]Unknown book: {book}. Only NOI is supported.[/]")
         raise SystemExit(1)
 
     from vedabase_notes_agent.parse.parse_noi import parse_noi
@@ -82,7 +81,7 @@ def parse_cmd(book, raw, out):
     raw_path = Path(raw) if raw else None
     out_path = Path(out) if out else None
     result   = parse_noi(raw_file=raw_path, out_file=out_path)
-    console.print(f"\n[bold green]Done.[/] Clean records saved to: {result}")
+    get_console().print(f"\n[bold green]Done.[/] Clean records saved to: {result}")
 
 
 # ── chunk ─────────────────────────────────────────────────────────────────────
@@ -97,10 +96,10 @@ def chunk_cmd(book, clean, out):
 
     Each verse produces 1-3 chunks (translation + purport parts).
     """
-    console.print(f"\n[bold]Step 3 — Chunk {book}[/]\n")
+    get_console().print(f"\n[bold]Step 3 — Chunk {book}[/]\n")
 
     if book.upper() != "NOI":
-        console.print(f"[red]Unknown book: {book}.[/]")
+        get_console().print(f"[red]Unknown book: {book}.[/]")
         raise SystemExit(1)
 
     from vedabase_notes_agent.chunk.chunk_text import chunk_noi
@@ -108,7 +107,7 @@ def chunk_cmd(book, clean, out):
     clean_path = Path(clean) if clean else None
     out_path   = Path(out)   if out   else None
     result     = chunk_noi(clean_file=clean_path, out_file=out_path)
-    console.print(f"\n[bold green]Done.[/] Chunks saved to: {result}")
+    get_console().print(f"\n[bold green]Done.[/] Chunks saved to: {result}")
 
 
 # ── index ─────────────────────────────────────────────────────────────────────
@@ -116,27 +115,31 @@ def chunk_cmd(book, clean, out):
 @cli.command("index")
 @click.option("--book",   default="NOI", show_default=True, help="Book to index.")
 @click.option("--chunks", default=None, help="Path to chunks JSONL file.")
-def index_cmd(book, chunks):
+@click.option("--rebuild", is_flag=True, help="Re-embed every chunk, even unchanged ones.")
+def index_cmd(book, chunks, rebuild):
     """
     STEP 4: Embed chunks and store them in the local vector database (ChromaDB).
 
     Downloads the embedding model on first run (~90 MB, then cached).
     """
-    console.print(f"\n[bold]Step 4 — Index {book}[/]\n")
+    get_console().print(f"\n[bold]Step 4 — Index {book}[/]\n")
 
     if book.upper() != "NOI":
-        console.print(f"[red]Unknown book: {book}.[/]")
+        get_console().print(f"[red]Unknown book: {book}.[/]")
         raise SystemExit(1)
 
-    from vedabase_notes_agent.chunk.chunk_text import load_chunks
+    from vedabase_notes_agent.chunk.chunk_text import iter_chunks
     from vedabase_notes_agent.index.vector_store import index_chunks, collection_size
 
+    # Stream chunks from disk — only one batch is in memory at a time
     chunks_path = Path(chunks) if chunks else None
-    all_chunks  = load_chunks(chunks_path)
 
-    console.print(f"Loaded {len(all_chunks)} chunks. Embedding and indexing...")
-    index_chunks(all_chunks)
-    console.print(f"\n[bold green]Done.[/] {collection_size()} chunks now in vector DB.")
+    get_console().print("Embedding and indexing chunks...")
+    indexed = index_chunks(iter_chunks(chunks_path), rebuild=rebuild)
+    get_console().print(
+        f"\n[bold green]Done.[/] Indexed {indexed} chunks; "
+        f"{collection_size()} chunks now in vector DB."
+    )
 
 
 # ── generate-notes ────────────────────────────────────────────────────────────
@@ -164,21 +167,24 @@ def generate_notes_cmd(book, topic, audience, duration_min, style, out):
       python -m vedabase_notes_agent.cli generate-notes \\
         --topic "controlling the six urges" --duration-min 90
     """
-    console.print(f"\n[bold]Generating notes for:[/] {topic}")
-    console.print(f"  Audience: {audience}")
-    console.print(f"  Duration: {duration_min} min")
-    console.print(f"  Style:    {style}\n")
+    get_console().print(f"\n[bold]Generating notes for:[/] {topic}")
+    get_console().print(f"  Audience: {audience}")
+    get_console().print(f"  Duration: {duration_min} min")
+    get_console().print(f"  Style:    {style}\n")
 
     from vedabase_notes_agent.agent.notes_agent import generate_notes
     from vedabase_notes_agent.export.export_markdown import export_notes
 
-    notes    = generate_notes(topic, audience, duration_min, style)
+    # Print the draft live as Claude writes it. console.out skips Rich
+    # markup, so citations like [NOI 3 Purport] are printed as-is.
+    notes    = generate_notes(
+        topic, audience, duration_min, style,
+        on_token=lambda text: get_console().out(text, end="", highlight=False),
+    )
     out_dir  = Path(out) if out else None
     out_path = export_notes(notes, topic, out_dir)
 
-    console.print(f"\n[bold green]Notes saved to:[/] {out_path}")
-    console.print("\n[dim]Preview (first 500 chars):[/]")
-    console.print(notes[:500] + ("..." if len(notes) > 500 else ""))
+    get_console().print(f"\n[bold green]Notes saved to:[/] {out_path}")
 
 
 # ── smoke-test ────────────────────────────────────────────────────────────────
@@ -207,10 +213,10 @@ def ui_cmd():
     import subprocess
     app_path = Path(__file__).parent.parent.parent.parent / "app.py"
     if not app_path.exists():
-        console.print(f"[red]Cannot find app.py at {app_path}[/]")
+        get_console().print(f"[red]Cannot find app.py at {app_path}[/]")
         raise SystemExit(1)
-    console.print(f"[green]Launching UI →[/] {app_path}")
-    console.print("[dim]Opening in browser... Press Ctrl+C to stop.[/]")
+    get_console().print(f"[green]Launching UI →[/] {app_path}")
+    get_console().print("[dim]Opening in browser... Press Ctrl+C to stop.[/]")
     subprocess.run(["streamlit", "run", str(app_path)])
 
 
@@ -0,0 +1,26 @@
+"""
+console.py
+----------
+The shared Rich console used for coloured terminal output.
+
+Beginner tip — why a function instead of `console = Console()`?
+  Importing rich and creating a Console (which probes the terminal) takes
+  a noticeable fraction of a second. Creating it on first use means
+  `cli --help`, shell tab-completion, and Streamlit pages that never print
+  don't pay that cost at import time.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@lru_cache(maxsize=1)
+def get_console() -> Console:
+    """Return the process-wide Console, creating it on first call."""
+    from rich.console import Console
+    return Console()
@@ -100,7 +100,7 @@ def _test_embedder() -> tuple[str, bool, str]:
         vecs = embed_texts(["A sober person who can tolerate the urge to speak."])
         assert len(vecs) == 1, "Expected 1 vector"
         assert len(vecs[0]) > 0, "Vector is empty"
-        assert isinstance(vecs[0][0], float), "Vector values should be floats"
+        assert vecs.dtype.kind == "f", "Vector values should be floats"
         return ("Embedder", True, f"Vector dim={len(vecs[0])}")
     except Exception as e:
         return ("Embedder", False, str(e))
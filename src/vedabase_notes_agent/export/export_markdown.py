@@ -11,13 +11,33 @@ Markdown is a simple text format that renders nicely in:
 
 from __future__ import annotations
 
-import re
-from datetime import datetime
+from datetime import date
 from pathlib import Path
 
 from vedabase_notes_agent.config import OUT_DIR
 
 
+class _SlugTable(dict):
+    """
+    A str.translate() table that deletes every character that isn't a
+    letter, digit, underscore, hyphen, or whitespace.
+
+    Beginner tip: translate() looks each character up in this dict.
+    Characters we haven't seen yet hit __missing__, which decides once
+    and remembers the answer — so the table covers all of Unicode
+    without listing it up front.
+    """
+
+    def __missing__(self, code: int) -> int | None:
+        ch   = chr(code)
+        keep = ch.isalnum() or ch in "_-" or ch.isspace()
+        self[code] = code if keep else None  # None = delete
+        return self[code]
+
+
+_SLUG_TABLE = _SlugTable()
+
+
 def export_notes(notes: str, topic: str, out_dir: Path | None = None) -> Path:
     """
     Save notes to a timestamped markdown file.
@@ -32,11 +52,12 @@ def export_notes(notes: str, topic: str, out_dir: Path | None = None) -> Path:
 
     # Convert topic to a safe filename slug
     # "Controlling the Senses!" → "controlling_the_senses"
-    slug = re.sub(r"[^\w\s-]", "", topic.lower())
-    slug = re.sub(r"[\s-]+", "_", slug).strip("_")
+    slug = topic.lower().translate(_SLUG_TABLE)
+    # Each run of spaces/hyphens becomes one "_"
+    slug = "_".join(slug.replace("-", " ").split()).strip("_")
     slug = slug[:50]  # keep filenames short
 
-    date_str = datetime.now().strftime("%Y-%m-%d")
+    date_str = date.today().isoformat()  # YYYY-MM-DD
     filename = f"notes_{slug}_{date_str}.md"
     out_path = out_dir / filename
 
@@ -14,40 +14,134 @@ No API key needed for embeddings. The model downloads once (~90 MB)
 and is cached in ~/.cache/huggingface/.
 """
 
+from __future__ import annotations
+
+import threading
 from functools import lru_cache
+from typing import TYPE_CHECKING
 
-from sentence_transformers import SentenceTransformer
+from vedabase_notes_agent.config import EMBED_BACKEND, EMBED_MODEL, EMBED_ONNX_FILE
 
-from vedabase_notes_agent.config import EMBED_MODEL
+if TYPE_CHECKING:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+
+# How many texts the model encodes per forward pass
+ENCODE_BATCH_SIZE = 64
+
+
+# Guards the first load — the UI may preload the model on a background
+# thread while a page asks for it at the same time.
+_MODEL_LOCK = threading.Lock()
 
 
-@lru_cache(maxsize=1)
 def get_model() -> SentenceTransformer:
     """
     Load (and cache) the embedding model.
 
-    @lru_cache means this function only runs once — the model is loaded
-    on first call and reused for every subsequent call. Loading a model
-    takes a few seconds so we avoid doing it repeatedly.
+    The model is loaded on first call and reused for every subsequent
+    call. Loading a model takes a few seconds so we avoid doing it
+    repeatedly. The lock makes callers on other threads wait for that
+    first load instead of starting a second one.
+    """
+    with _MODEL_LOCK:
+        return _load_model()
+
+
+@lru_cache(maxsize=1)
+def _load_model() -> SentenceTransformer:
     """
+    @lru_cache means this function only runs once.
+
+    sentence-transformers (and torch behind it) is imported here rather
+    than at the top of the file, so pages that only check the vector DB
+    don't pay for loading the ML stack.
+
+    With EMBED_BACKEND=onnx the int8-quantized ONNX export of the model is
+    loaded instead of the PyTorch weights. It is a drop-in swap: encode()
+    and the vectors it returns work the same way.
+    """
+    from sentence_transformers import SentenceTransformer
+    if EMBED_BACKEND == "onnx":
+        return SentenceTransformer(
+            EMBED_MODEL,
+            backend="onnx",
+            model_kwargs={"file_name": EMBED_ONNX_FILE},
+        )
     return SentenceTransformer(EMBED_MODEL)
 
 
-def embed_texts(texts: list[str]) -> list[list[float]]:
+def embedder_id() -> str:
+    """
+    A label for the model + backend that embed_texts() currently uses,
+    e.g. "all-MiniLM-L6-v2|torch". Stored with every indexed chunk, so the
+    indexer can tell when vectors were made by a different embedder.
     """
-    Convert a list of strings into a list of embedding vectors.
+    if EMBED_BACKEND == "onnx":
+        return f"{EMBED_MODEL}|onnx|{EMBED_ONNX_FILE}"
+    return f"{EMBED_MODEL}|{EMBED_BACKEND}"
+
 
-    Each vector is a list of 384 floats (for all-MiniLM-L6-v2).
-    ChromaDB stores these vectors and uses them to find similar chunks.
+def preload_model_in_background() -> None:
     """
-    model = get_model()
-    # encode() returns numpy arrays; tolist() converts to plain Python lists
-    return model.encode(texts, show_progress_bar=False).tolist()
+    Start loading the model on a daemon thread and return immediately.
+
+    The first load downloads (~90 MB) and initialises the model, which
+    takes seconds. Starting it early means the model is usually warm by
+    the time indexing or search needs it.
+    """
+    threading.Thread(target=_preload_model, daemon=True).start()
+
+
+def _preload_model() -> None:
+    try:
+        get_model()
+    except Exception:
+        pass  # a real problem surfaces when indexing or search calls get_model()
 
 
-def embed_query(query: str) -> list[float]:
+def embed_texts(texts: list[str]) -> np.ndarray:
+    """
+    Convert a list of strings into a matrix of embedding vectors.
+
+    Returns a float32 numpy array with one row per text, 384 floats each (for
+    all-MiniLM-L6-v2). ChromaDB accepts the array as-is, so there is no
+    need to turn it into millions of Python floats first.
+
+    Vectors are normalized to length 1, so cosine similarity is a plain
+    dot product.
+
+    Duplicate texts are embedded once and their row is reused. (No need
+    to sort by length first: encode() already groups similar-length texts
+    into each forward pass, so little time goes on padding.)
+    """
+    unique = list(dict.fromkeys(texts))  # keeps first-seen order
+    model  = get_model()
+    vecs   = model.encode(
+        unique,
+        batch_size=ENCODE_BATCH_SIZE,
+        show_progress_bar=False,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+    ).astype("float32", copy=False)  # a no-op unless the backend returns float64
+
+    if len(unique) == len(texts):
+        return vecs
+    row = {text: i for i, text in enumerate(unique)}
+    return vecs[[row[text] for text in texts]]
+
+
+def embed_query(query: str) -> np.ndarray:
     """
     Embed a single query string.
     Used at search time to find chunks similar to the query.
+
+    Passing one string (not a list) makes encode() return a 1-D vector
+    directly, with no wrapping list or row indexing.
     """
-    return embed_texts([query])[0]
+    return get_model().encode(
+        query,
+        show_progress_bar=False,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+    )
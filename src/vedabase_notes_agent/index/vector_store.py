@@ -16,22 +16,42 @@ No server to start, no cloud account needed. Just files on disk.
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import chromadb
 from chromadb.config import Settings
 
 from vedabase_notes_agent.config import INDEX_DIR
-from vedabase_notes_agent.index.embed import embed_texts
+from vedabase_notes_agent.index.embed import embed_texts, embedder_id
+
+if TYPE_CHECKING:
+    import numpy as np
 
 # Name for our collection inside ChromaDB (like a table in a SQL database)
 COLLECTION_NAME = "noi"
 
+# Bumped every time index_chunks() rewrites the collection in this process;
+# part of index_version() below.
+_index_version = 0
+
+# ChromaDB's SQLite files — their modification times change whenever any
+# process (e.g. the CLI while the UI is open) writes to the index.
+_DB_FILES = ("chroma.sqlite3", "chroma.sqlite3-wal")
+
 
+@lru_cache(maxsize=1)
 def get_client() -> chromadb.PersistentClient:
     """
     Open (or create) the local ChromaDB database.
     Data is saved to data/index/ so it persists between sessions.
+
+    Opening the client reads SQLite and loads the search index, so it is
+    cached — every page rerun and CLI call in this process shares one client.
     """
     INDEX_DIR.mkdir(parents=True, exist_ok=True)
     return chromadb.PersistentClient(
@@ -43,18 +63,93 @@ def get_client() -> chromadb.PersistentClient:
 def get_collection(client: chromadb.PersistentClient | None = None):
     """
     Get the NOI collection, creating it if it doesn't exist.
+
+    Without an explicit client the cached default handle is returned.
+    """
+    if client is None:
+        return _default_collection()
+    return _open_collection(client)
+
+
+@lru_cache(maxsize=1)
+def _default_collection():
+    """The collection on the shared client — built once per process."""
+    return _open_collection(get_client())
+
+
+def reset_clients() -> None:
+    """
+    Forget the cached client and collection handles.
+
+    The next get_client() / get_collection() opens them again — useful in
+    tests that point INDEX_DIR somewhere else, or after deleting data/index/.
     """
-    client = client or get_client()
+    _default_collection.cache_clear()
+    get_client.cache_clear()
+
+
+# ChromaDB searches with an HNSW graph (approximate nearest neighbours),
+# not a linear scan. The knobs:
+#   M               links per node. NOI has only ~40 chunks, so 8 links
+#                   already connect the graph well and use half the memory
+#                   of 16. Raise it (16-32) for a much larger library —
+#                   fewer links means lower recall on big graphs.
+#   construction_ef / search_ef
+#                   how many candidates are explored while building /
+#                   searching. Higher = better recall, slower. 40 at query
+#                   time is plenty when top_k is 8.
+#   batch_size / sync_threshold
+#                   how many vectors are buffered before being added to the
+#                   graph / flushed to disk. 200 matches index_chunks()'s
+#                   batch size, so each batch goes into the graph in one go.
+# They only take effect when the collection is first created — delete
+# data/index/ to rebuild an existing one with new settings.
+HNSW_SETTINGS = {
+    "hnsw:space":           "cosine",
+    "hnsw:M":               8,
+    "hnsw:construction_ef": 64,
+    "hnsw:search_ef":       40,
+    "hnsw:batch_size":      200,
+    "hnsw:sync_threshold":  1000,
+}
+
+
+def _open_collection(client: chromadb.PersistentClient):
     return client.get_or_create_collection(
         name=COLLECTION_NAME,
         # ChromaDB will use our embeddings, not its own
-        metadata={"hnsw:space": "cosine"},
+        metadata=HNSW_SETTINGS,
     )
 
 
-def index_chunks(chunks: list[dict]) -> None:
+def index_chunks(
+    chunks:     Iterable[dict],
+    batch_size: int  = 200,
+    rebuild:    bool = False,
+) -> int:
     """
-    Embed all chunks and add them to ChromaDB.
+    Embed all chunks and upsert them into ChromaDB.
+
+    `chunks` can be a list or a lazy iterator (e.g. iter_chunks()) —
+    only a couple of batches are held in memory at a time.
+    Returns the number of chunks indexed.
+
+    Beginner tip — overlapping the two slow steps:
+      Embedding is CPU work; collection.add() is mostly disk writes.
+      While ChromaDB writes batch N on a helper thread, the main thread
+      is already embedding batch N+1. Batches of ~200 keep the number
+      of (slow) database commits low.
+
+    Beginner tip — upsert instead of delete + re-add:
+      Re-running the index used to wipe the collection, which makes ChromaDB
+      rebuild its search graph from scratch. Now each chunk is written with
+      upsert() keyed on its chunk_id, and chunks whose text and metadata are
+      already stored unchanged are skipped — they aren't even re-embedded.
+      Chunks that no longer exist in the input are deleted at the end.
+
+      Vectors from different models can't be mixed, so if the collection
+      was built with another EMBED_MODEL / EMBED_BACKEND (or rebuild=True),
+      it is dropped and every chunk is embedded again.
 
     ChromaDB needs three things per item:
       - ids:        unique string IDs
@@ -63,48 +158,132 @@ def index_chunks(chunks: list[dict]) -> None:
       - metadatas:  extra info (verse number, source URI, etc.)
     """
     collection = get_collection()
+    if rebuild or _built_with_other_embedder(collection):
+        print("  Embedding model changed (or rebuild requested) — rebuilding the index...")
+        collection = _recreate_collection()
+
+    # Batch processing — embed batch_size chunks at a time to avoid memory issues
+    chunks = iter(chunks)
+    done = 0
+    seen: set[str] = set()          # every chunk_id in the input
+    pending: Future | None = None   # the batch ChromaDB is still writing
+
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        while batch := list(islice(chunks, batch_size)):
+            seen.update(c["chunk_id"] for c in batch)
+            done += len(batch)
+
+            batch = _changed_chunks(collection, batch)
+            if not batch:
+                continue  # everything in this batch is already up to date
 
-    # Check how many are already indexed to avoid duplicates
-    existing = collection.count()
-    if existing > 0:
-        print(f"  Collection already has {existing} chunks. Clearing and re-indexing...")
-        collection.delete(where={"book": "NOI"})
-
-    # Batch processing — embed 32 chunks at a time to avoid memory issues
-    batch_size = 32
-    total = len(chunks)
-
-    for i in range(0, total, batch_size):
-        batch = chunks[i : i + batch_size]
-
-        ids        = [c["chunk_id"] for c in batch]
-        texts      = [c["text"]     for c in batch]
-        metadatas  = [
-            {
-                "parent_id":    c["parent_id"],
-                "book":         c["book"],
-                "verse_number": c["verse_number"],
-                "section":      c["section"],
-                "source_uri":   c["source_uri"],
-            }
-            for c in batch
+            ids        = [c["chunk_id"] for c in batch]
+            texts      = [c["text"]     for c in batch]
+            metadatas  = [_chunk_metadata(c) for c in batch]
+
+            # Compute embeddings for this batch (overlaps the previous write)
+            embeddings = embed_texts(texts)
+
+            # Wait for the previous batch to be stored before queueing this one
+            if pending is not None:
+                pending.result()
+
+            pending = writer.submit(
+                collection.upsert,
+                ids=ids,
+                embeddings=embeddings,
+                documents=texts,
+                metadatas=metadatas,
+            )
+            print(f"  Indexed {done} chunks...")
+
+        if pending is not None:
+            pending.result()
+
+    # Remove chunks left over from an earlier run that are no longer produced.
+    # An empty input (e.g. an empty chunks file) is more likely a mistake than
+    # a request to empty the index, so nothing is deleted then.
+    if done:
+        stale = [
+            i for i in collection.get(where={"book": "NOI"}, include=[])["ids"]
+            if i not in seen
         ]
+        if stale:
+            collection.delete(ids=stale)
+            print(f"  Removed {len(stale)} stale chunks.")
 
-        # Compute embeddings for this batch
-        embeddings = embed_texts(texts)
+    global _index_version
+    _index_version += 1
 
-        collection.add(
-            ids=ids,
-            embeddings=embeddings,
-            documents=texts,
-            metadatas=metadatas,
-        )
+    return done
 
-        print(f"  Indexed {min(i + batch_size, total)}/{total} chunks...")
+
+def _chunk_metadata(chunk: dict) -> dict:
+    """The metadata stored alongside each chunk in ChromaDB."""
+    return {
+        "parent_id":    chunk["parent_id"],
+        "book":         chunk["book"],
+        "verse_number": chunk["verse_number"],
+        "section":      chunk["section"],
+        "source_uri":   chunk["source_uri"],
+        "embedder":     embedder_id(),  # which model made the vector
+    }
+
+
+def _built_with_other_embedder(collection) -> bool:
+    """True if the collection holds vectors from a different embedder."""
+    sample = collection.get(limit=1, include=["metadatas"])["metadatas"]
+    return bool(sample) and sample[0].get("embedder") != embedder_id()
+
+
+def _recreate_collection():
+    """Delete the collection and return a new, empty one."""
+    client = get_client()
+    client.delete_collection(COLLECTION_NAME)
+    _default_collection.cache_clear()
+    return get_collection()
+
+
+def _changed_chunks(collection, batch: list[dict]) -> list[dict]:
+    """
+    The chunks in `batch` that are new, or whose text or metadata differ
+    from what the collection already stores under the same chunk_id.
+    """
+    stored = collection.get(
+        ids=[c["chunk_id"] for c in batch],
+        include=["documents", "metadatas"],
+    )
+    current = {
+        i: (doc, meta)
+        for i, doc, meta in zip(stored["ids"], stored["documents"], stored["metadatas"])
+    }
+    return [
+        c for c in batch
+        if current.get(c["chunk_id"]) != (c["text"], _chunk_metadata(c))
+    ]
+
+
+def index_version() -> tuple[int, ...]:
+    """
+    A value that changes whenever the index changes, so caches of search
+    results (see retriever.py, ui_cache.py) can use it in their keys and
+    know when their entries are out of date.
+
+    It combines this process's re-index counter with the chunk count and
+    the database files' modification times, so re-indexing from another
+    process (e.g. the CLI while the Streamlit app is running) counts too.
+    """
+    mtimes = []
+    for name in _DB_FILES:
+        try:
+            mtimes.append((INDEX_DIR / name).stat().st_mtime_ns)
+        except FileNotFoundError:
+            mtimes.append(0)
+    return (_index_version, collection_size(), *mtimes)
 
 
 def query_collection(
-    query_embedding: list[float],
+    query_embedding: Sequence[float] | np.ndarray,
     top_k: int = 8,
     where: dict | None = None,
 ) -> list[dict]:
@@ -116,26 +295,37 @@ def query_collection(
     """
     collection = get_collection()
 
+    # An empty collection has nothing to find — skip the search entirely.
+    # Asking for more results than exist only makes ChromaDB warn, so cap it.
+    size = collection.count()
+    if size == 0:
+        return []
+
     results = collection.query(
         query_embeddings=[query_embedding],
-        n_results=top_k,
+        n_results=min(top_k, size),
         where=where,
         include=["documents", "metadatas", "distances"],
     )
 
     # Flatten ChromaDB's nested result format into a simple list
-    hits = []
-    for i, doc in enumerate(results["documents"][0]):
-        hits.append({
+    # (each field is a list per query; we sent one query, hence [0])
+    return [
+        {
             "text":         doc,
-            "chunk_id":     results["ids"][0][i],
-            "verse_number": results["metadatas"][0][i]["verse_number"],
-            "section":      results["metadatas"][0][i]["section"],
-            "source_uri":   results["metadatas"][0][i]["source_uri"],
-            "distance":     results["distances"][0][i],
-        })
-
-    return hits
+            "chunk_id":     chunk_id,
+            "verse_number": meta["verse_number"],
+            "section":      meta["section"],
+            "source_uri":   meta["source_uri"],
+            "distance":     distance,
+        }
+        for doc, chunk_id, meta, distance in zip(
+            results["documents"][0],
+            results["ids"][0],
+            results["metadatas"][0],
+            results["distances"][0],
+        )
+    ]
 
 
 def collection_size() -> int:
@@ -9,7 +9,7 @@ Design principle:
     <your-project>/noi-search/scraper.py
 
   This module is a thin adapter that:
-    1. Tries to import and call the existing scraper
+    1. Tries to run the existing scraper (in its own Python process)
     2. Falls back to reading data.json if scraper isn't available
     3. Saves the result to our data/raw/noi/ directory
 
@@ -22,17 +22,26 @@ Beginner tip — what is a "wrapper"?
 
 from __future__ import annotations
 
-import importlib.util
-import json
 import shutil
+import subprocess
 import sys
 from pathlib import Path
 
-from rich.console import Console
-
 from vedabase_notes_agent.config import NOI_SCRAPER_PATH, RAW_DIR
+from vedabase_notes_agent.console import get_console
+
+# Give up on the scraper if it hasn't finished after this long
+SCRAPER_TIMEOUT_SECONDS = 30 * 60
 
-console = Console()
+# Run in the child process: load the scraper file given as argv[1] by path
+# (so any file name works) and call its scrape() function.
+_SCRAPER_RUNNER = (
+    "import importlib.util, sys\n"
+    "spec = importlib.util.spec_from_file_location('noi_scraper', sys.argv[1])\n"
+    "module = importlib.util.module_from_spec(spec)\n"
+    "spec.loader.exec_module(module)\n"
+    "module.scrape()\n"
+)
 
 
 def ingest_noi(out_dir: Path | None = None) -> Path:
@@ -42,7 +51,7 @@ def ingest_noi(out_dir: Path | None = None) -> Path:
     Returns the Path to the saved raw JSON file.
 
     Strategy (tries each in order):
-      1. If NOI_SCRAPER_PATH is set → import and run the existing scraper
+      1. If NOI_SCRAPER_PATH is set → run the existing scraper
       2. If data.json lives next to the scraper → copy it
       3. Raise a clear error telling the user what to do
     """
@@ -54,23 +63,22 @@ def ingest_noi(out_dir: Path | None = None) -> Path:
     # ── Strategy 1: Run the existing scraper ─────────────────────────────────
     scraper_path = NOI_SCRAPER_PATH
     if scraper_path and Path(scraper_path).exists():
-        console.print(f"[green]Found existing scraper at:[/] {scraper_path}")
-        console.print("[yellow]Running scraper (this fetches from vedabase.io)...[/]")
-
-        pages = _run_existing_scraper(Path(scraper_path))
-        if pages:
-            with open(out_file, "w", encoding="utf-8") as f:
-                json.dump(pages, f, ensure_ascii=False, indent=2)
-            console.print(f"[green]Saved {len(pages)} pages →[/] {out_file}")
+        get_console().print(f"[green]Found existing scraper at:[/] {scraper_path}")
+        get_console().print("[yellow]Running scraper (this fetches from vedabase.io)...[/]")
+
+        data_json = _run_existing_scraper(Path(scraper_path))
+        if data_json:
+            shutil.copy(data_json, out_file)
+            get_console().print(f"[green]Saved scraped pages →[/] {out_file}")
             return out_file
 
     # ── Strategy 2: Look for data.json next to the scraper ───────────────────
     if scraper_path:
         data_json = Path(scraper_path).parent / "data.json"
         if data_json.exists():
-            console.print(f"[green]Found existing data.json at:[/] {data_json}")
+            get_console().print(f"[green]Found existing data.json at:[/] {data_json}")
             shutil.copy(data_json, out_file)
-            console.print(f"[green]Copied to →[/] {out_file}")
+            get_console().print(f"[green]Copied to →[/] {out_file}")
             return out_file
 
     # ── Strategy 3: Look for data.json in the default noi-search location ────
@@ -80,9 +88,9 @@ def ingest_noi(out_dir: Path | None = None) -> Path:
         / "noi-search" / "data.json"
     )
     if default_data.exists():
-        console.print(f"[green]Found data.json at:[/] {default_data}")
+        get_console().print(f"[green]Found data.json at:[/] {default_data}")
         shutil.copy(default_data, out_file)
-        console.print(f"[green]Copied to →[/] {out_file}")
+        get_console().print(f"[green]Copied to →[/] {out_file}")
         return out_file
 
     # ── Nothing found — give clear instructions ───────────────────────────────
@@ -99,48 +107,32 @@ def ingest_noi(out_dir: Path | None = None) -> Path:
     )
 
 
-def _run_existing_scraper(scraper_path: Path) -> list[dict] | None:
+def _run_existing_scraper(scraper_path: Path) -> Path | None:
     """
-    Dynamically import the existing scraper module and call its scrape() function.
+    Run the existing scraper's scrape() function in a separate Python process.
 
-    importlib lets us load a Python file by path at runtime —
-    like doing 'import scraper' but from any location on disk.
+    Returns the path of the data.json it writes, or None if it failed.
 
-    The existing scraper writes to data.json on disk AND we intercept
-    the result by reading the file it creates.
+    Beginner tip — why a separate process?
+      The scraper is someone else's code. Running it with subprocess gives it
+      its own working directory (so data.json lands in its own folder) and its
+      own imports, and none of that leaks into this app: our working
+      directory never changes, and its modules are gone when it exits.
     """
     try:
-        # Load the scraper module from disk
-        spec = importlib.util.spec_from_file_location("noi_scraper", scraper_path)
-        if spec is None or spec.loader is None:
-            console.print("[red]Could not load scraper module.[/]")
-            return None
-
-        module = importlib.util.module_from_spec(spec)
-        sys.modules["noi_scraper"] = module
-
-        # Change working directory so scraper writes files in its own folder
-        import os
-        original_cwd = os.getcwd()
-        os.chdir(scraper_path.parent)
-
-        spec.loader.exec_module(module)  # type: ignore
-
-        # Call the scraper's scrape() function
-        module.scrape()  # type: ignore
-
-        # The scraper writes data.json — read it back
-        data_json = scraper_path.parent / "data.json"
-        if data_json.exists():
-            with open(data_json, encoding="utf-8") as f:
-                pages = json.load(f)
-            os.chdir(original_cwd)
-            return pages
-
-        os.chdir(original_cwd)
-        return None
-
+        # Like `cd <scraper folder> && python -c "<load scraper.py; scrape()>" scraper.py`
+        # The path travels as an argument, never as part of the code.
+        subprocess.run(
+            [sys.executable, "-c", _SCRAPER_RUNNER, str(scraper_path.resolve())],
+            cwd=scraper_path.parent,
+            check=True,
+            timeout=SCRAPER_TIMEOUT_SECONDS,
+        )
     except Exception as exc:
-        console.print(f"[red]Scraper error:[/] {exc}")
-        console.print("[yellow]Falling back to data.json copy...[/]")
+        get_console().print(f"[red]Scraper error:[/] {exc}")
+        get_console().print("[yellow]Falling back to data.json copy...[/]")
         return None
+
+    # The scraper writes data.json next to itself
+    data_json = scraper_path.parent / "data.json"
+    return data_json if data_json.exists() else None
@@ -1,7 +1,7 @@
 """
 jobs.py
 -------
-Background job queue for note generation.
+Background job queue for note generation and the data pipeline.
 
 Beginner tip — why a job queue?
   Generating notes takes 20-60 seconds (multiple Claude API calls).
@@ -23,17 +23,34 @@ Job lifecycle:
 
 from __future__ import annotations
 
-import json
+import os
 import threading
+import time
 import uuid
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
 from vedabase_notes_agent.config import OUT_DIR
 
 # Jobs are stored as small JSON files in data/outputs/jobs/
 JOBS_DIR = OUT_DIR / "jobs"
 
+# Every job record in one file, so listing jobs is a single read.
+# The per-job files remain the source for get_job() / _update_job().
+INDEX_FILE = JOBS_DIR / "index.json"
+
+# Job threads all live in this process; the lock stops two of them
+# rewriting a job or index.json at the same moment and losing an update.
+_jobs_lock = threading.Lock()
+
+# Records of the jobs still running in this process. Updates change the
+# dict here instead of re-reading the job file first; finished jobs are
+# dropped, since their files hold the final state.
+_live_jobs: dict[str, dict] = {}
+
 
 # ── Start a job ───────────────────────────────────────────────────────────────
 
@@ -54,6 +71,7 @@ def start_job(
     # Write the initial job record to disk
     _write_job(job_id, {
         "job_id":      job_id,
+        "kind":        "notes",
         "topic":       topic,
         "audience":    audience,
         "duration":    duration,
@@ -76,6 +94,34 @@ def start_job(
     return job_id
 
 
+def start_pipeline_job() -> str:
+    """
+    Run the incomplete pipeline steps (ingest → parse → chunk → index)
+    in a background thread, so the UI stays responsive while it works.
+    Returns the job_id.
+    """
+    JOBS_DIR.mkdir(parents=True, exist_ok=True)
+
+    job_id = str(uuid.uuid4())[:8]
+
+    _write_job(job_id, {
+        "job_id":       job_id,
+        "kind":         "pipeline",
+        "topic":        "Pipeline: ingest → index",
+        "status":       "running",
+        "step":         None,
+        "created_at":   datetime.now().isoformat(),
+        "completed_at": None,
+        "result_path":  None,
+        "error":        None,
+    })
+
+    thread = threading.Thread(target=_run_pipeline_job, args=(job_id,), daemon=True)
+    thread.start()
+
+    return job_id
+
+
 # ── Background worker ─────────────────────────────────────────────────────────
 
 def _run_job(job_id: str, topic: str, audience: str, duration: int, style: str):
@@ -87,7 +133,9 @@ def _run_job(job_id: str, topic: str, audience: str, duration: int, style: str):
         from vedabase_notes_agent.agent.notes_agent import generate_notes
         from vedabase_notes_agent.export.export_markdown import export_notes
 
-        notes      = generate_notes(topic, audience, duration, style)
+        notes      = generate_notes(
+            topic, audience, duration, style, on_token=_draft_progress(job_id)
+        )
         saved_path = export_notes(notes, topic)
 
         _update_job(job_id, {
@@ -103,26 +151,87 @@ def _run_job(job_id: str, topic: str, audience: str, duration: int, style: str):
         })
 
 
+def _draft_progress(job_id: str) -> Callable[[str], None]:
+    """
+    An on_token callback for generate_notes() that records how much of the
+    draft has streamed in, so the sidebar can show progress.
+    The job file is rewritten at most once a second, not on every token.
+    """
+    state = {"chars": 0, "written_at": 0.0}
+
+    def on_token(text: str):
+        state["chars"] += len(text)
+        now = time.monotonic()
+        if now - state["written_at"] >= 1.0:
+            state["written_at"] = now
+            _update_job(job_id, {"step": f"Drafting... {state['chars']:,} characters"})
+
+    return on_token
+
+
+def _run_pipeline_job(job_id: str):
+    """
+    Runs in a background thread.
+    Skips steps whose output already exists; indexing always runs.
+    """
+    try:
+        from vedabase_notes_agent.config import CHUNKS_DIR, CLEAN_DIR, RAW_DIR
+
+        if not (RAW_DIR / "noi" / "noi_raw.json").exists():
+            _update_job(job_id, {"step": "Step 1: Ingesting..."})
+            from vedabase_notes_agent.ingest.ingest_noi import ingest_noi
+            ingest_noi()
+
+        if not (CLEAN_DIR / "noi_clean.jsonl").exists():
+            _update_job(job_id, {"step": "Step 2: Parsing..."})
+            from vedabase_notes_agent.parse.parse_noi import parse_noi
+            parse_noi()
+
+        if not (CHUNKS_DIR / "noi_chunks.jsonl").exists():
+            _update_job(job_id, {"step": "Step 3: Chunking..."})
+            from vedabase_notes_agent.chunk.chunk_text import chunk_noi
+            chunk_noi()
+
+        _update_job(job_id, {"step": "Step 4: Indexing..."})
+        from vedabase_notes_agent.chunk.chunk_text import iter_chunks
+        from vedabase_notes_agent.index.vector_store import index_chunks
+        indexed = index_chunks(iter_chunks())
+
+        _update_job(job_id, {
+            "status":       "done",
+            "step":         f"{indexed} chunks indexed",
+            "completed_at": datetime.now().isoformat(),
+        })
+
+    except Exception as exc:
+        _update_job(job_id, {
+            "status": "error",
+            "error":  str(exc),
+        })
+
+
 # ── Read jobs ─────────────────────────────────────────────────────────────────
 
 def get_all_jobs() -> list[dict]:
-    """Return all jobs, newest first."""
+    """
+    Return all jobs, newest first.
+
+    The sidebar calls this every couple of seconds on every page, so it
+    reads the one index file rather than opening every job file.
+    """
     JOBS_DIR.mkdir(parents=True, exist_ok=True)
-    jobs = []
-    for f in JOBS_DIR.glob("*.json"):
-        try:
-            jobs.append(json.loads(f.read_text(encoding="utf-8")))
-        except Exception:
-            pass
-    return sorted(jobs, key=lambda j: j.get("created_at", ""), reverse=True)
+    with _jobs_lock:
+        index = _load_index()
+        _fail_interrupted_jobs(index)
+    return sorted(index.values(), key=lambda j: j.get("created_at", ""), reverse=True)
 
 
 def get_job(job_id: str) -> dict | None:
     """Return a single job by ID, or None if not found."""
-    job_file = JOBS_DIR / f"{job_id}.json"
-    if job_file.exists():
-        return json.loads(job_file.read_text(encoding="utf-8"))
-    return None
+    with _jobs_lock:
+        if job_id in _live_jobs:
+            return dict(_live_jobs[job_id])  # a copy, so callers can't change it
+    return _read_job_file(job_id)
 
 
 def clear_job(job_id: str):
@@ -130,21 +239,112 @@ def clear_job(job_id: str):
     job_file = JOBS_DIR / f"{job_id}.json"
     if job_file.exists():
         job_file.unlink()
-
-
-def has_running_jobs() -> bool:
-    """Quick check — is anything still generating?"""
-    return any(j["status"] == "running" for j in get_all_jobs())
+    with _jobs_lock:
+        _live_jobs.pop(job_id, None)
+        index = _load_index()
+        if index.pop(job_id, None) is not None:
+            _write_json(INDEX_FILE, index)
+
+
+def has_running_jobs(kind: str | None = None) -> bool:
+    """Quick check — is anything still running? Optionally only jobs of one kind."""
+    return any(
+        j["status"] == "running" and (kind is None or j.get("kind", "notes") == kind)
+        for j in get_all_jobs()
+    )
 
 
 # ── Write helpers ─────────────────────────────────────────────────────────────
 
 def _write_job(job_id: str, data: dict):
-    job_file = JOBS_DIR / f"{job_id}.json"
-    job_file.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    """Save a new job record."""
+    with _jobs_lock:
+        _live_jobs[job_id] = data
+        _save_job(job_id, data)
 
 
 def _update_job(job_id: str, updates: dict):
-    job = get_job(job_id) or {}
-    job.update(updates)
-    _write_job(job_id, job)
+    """
+    Apply `updates` to a job and save it — one read-modify-write under
+    the lock, so two updates to the same job can't overwrite each other.
+    """
+    with _jobs_lock:
+        job = _live_jobs.get(job_id) or _read_job_file(job_id) or {}
+        job.update(updates)
+        if job.get("status") in ("done", "error"):
+            _live_jobs.pop(job_id, None)
+        else:
+            _live_jobs[job_id] = job
+        _save_job(job_id, job)
+
+
+def _save_job(job_id: str, job: dict):
+    """Write a job to its own file and to the index. Call with _jobs_lock held."""
+    _write_json(JOBS_DIR / f"{job_id}.json", job, pretty=True)
+    index = _load_index()
+    index[job_id] = job
+    _write_json(INDEX_FILE, index)
+
+
+def _fail_interrupted_jobs(index: dict[str, dict]):
+    """
+    Mark "running" jobs that no thread in this process is working on as
+    errors, and save that. Call with _jobs_lock held.
+
+    Job threads die with the app, so after a restart their records would
+    otherwise say "running" forever — hiding Run All on the Pipeline page
+    and leaving a job in the sidebar that can't be dismissed.
+    """
+    stale = [
+        job_id for job_id, job in index.items()
+        if job.get("status") == "running" and job_id not in _live_jobs
+    ]
+    for job_id in stale:
+        index[job_id].update({
+            "status": "error",
+            "error":  "Interrupted — the app stopped while this job was running.",
+        })
+        _write_json(JOBS_DIR / f"{job_id}.json", index[job_id], pretty=True)
+    if stale:
+        _write_json(INDEX_FILE, index)
+
+
+def _read_job_file(job_id: str) -> dict | None:
+    job_file = JOBS_DIR / f"{job_id}.json"
+    if job_file.exists():
+        return orjson.loads(job_file.read_bytes())
+    return None
+
+
+def _write_json(path: Path, data, pretty: bool = False):
+    """
+    Write JSON to a temporary file, then rename it over `path`.
+
+    os.replace() swaps the file in one step, so a reader never sees a
+    half-written file — it gets either the old version or the new one.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+    os.replace(tmp, path)
+
+
+def _load_index() -> dict[str, dict]:
+    """
+    index.json as {job_id: job}. If it is missing or unreadable (e.g. jobs
+    created before the index existed), it is rebuilt from the job files.
+    """
+    try:
+        return orjson.loads(INDEX_FILE.read_bytes())
+    except (OSError, ValueError):
+        pass
+
+    index = {}
+    for f in JOBS_DIR.glob("*.json"):
+        if f == INDEX_FILE:
+            continue
+        try:
+            job = orjson.loads(f.read_bytes())
+            index[job["job_id"]] = job
+        except Exception:
+            pass
+    return index
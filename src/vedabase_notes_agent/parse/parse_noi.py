@@ -23,16 +23,23 @@ Beginner tip — what is JSONL?
 
 from __future__ import annotations
 
-import json
 import re
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
-from rich.console import Console
+import ijson
+import orjson
 
 from vedabase_notes_agent.config import CLEAN_DIR, RAW_DIR
+from vedabase_notes_agent.console import get_console
 
-console = Console()
-
+# Pages are parsed in batches of this size. If the first batch is full (a
+# big book), batches are spread over all CPU cores; NOI has ~12 pages, so
+# it always takes the simple single-process path.
+PARALLEL_PARSE_BATCH = 1000
 
 # ── Public entry point ────────────────────────────────────────────────────────
 
@@ -44,30 +51,52 @@ def parse_noi(
     Read the raw JSON, parse each page, and write clean JSONL.
 
     Returns the path to the output .jsonl file.
+
+    Beginner tip — streaming:
+      json.load() would read the whole raw file into memory before parsing
+      a single page. ijson walks the JSON array one item at a time instead,
+      and records are written batch by batch, so memory use stays at about
+      one batch of pages no matter how big the book is.
     """
     raw_file = raw_file or (RAW_DIR / "noi" / "noi_raw.json")
     out_file = out_file or (CLEAN_DIR / "noi_clean.jsonl")
     out_file.parent.mkdir(parents=True, exist_ok=True)
 
-    # Load raw pages
-    with open(raw_file, encoding="utf-8") as f:
-        pages: list[dict] = json.load(f)
+    get_console().print(f"[cyan]Parsing {raw_file.name}...[/]")
+
+    # Stream raw pages in, write one JSON object per line out
+    with open(raw_file, "rb") as f_in, open(out_file, "wb") as f_out:
+        pages = ijson.items(f_in, "item")
+        batch = list(islice(pages, PARALLEL_PARSE_BATCH))
+
+        if len(batch) < PARALLEL_PARSE_BATCH:
+            count = _write_records(f_out, map(_parse_page, batch))
+        else:
+            # Each page is independent regex work, so worker processes can
+            # parse a batch in parallel; chunksize=64 cuts pickling overhead.
+            count = 0
+            with ProcessPoolExecutor() as pool:
+                while batch:
+                    count += _write_records(
+                        f_out, pool.map(_parse_page, batch, chunksize=64)
+                    )
+                    batch = list(islice(pages, PARALLEL_PARSE_BATCH))
+
+    get_console().print(f"[green]Parsed {count} records →[/] {out_file}")
+    return out_file
 
-    console.print(f"[cyan]Parsing {len(pages)} pages...[/]")
 
-    records: list[dict] = []
-    for page in pages:
-        record = _parse_page(page)
+def _write_records(f_out, records: Iterable[dict | None]) -> int:
+    """
+    Write each non-empty record as one JSONL line; return how many were written.
+    orjson writes UTF-8 bytes, keeping diacritics as-is.
+    """
+    count = 0
+    for record in records:
         if record:
-            records.append(record)
-
-    # Write one JSON object per line
-    with open(out_file, "w", encoding="utf-8") as f:
-        for record in records:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
-
-    console.print(f"[green]Parsed {len(records)} records →[/] {out_file}")
-    return out_file
+            f_out.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+            count += 1
+    return count
 
 
 # ── Per-page parsing ──────────────────────────────────────────────────────────
@@ -116,6 +145,34 @@ def _parse_page(page: dict) -> dict | None:
 
 # ── Section extraction helpers ────────────────────────────────────────────────
 
+# A transliteration line: after stripping it is 21-499 chars long, contains
+# Sanskrit diacritics (ā, ī, ū, ṛ, ṁ, ḥ, etc.) and isn't a TRANSLATION /
+# PURPORT heading. In MULTILINE mode ^ and $ match at every line, so one
+# search() finds the first such line without splitting the text in Python.
+_TRANSLIT_RE = re.compile(
+    r"^[^\S\n]*"                                # leading spaces (stripped)
+    r"(?=[^\n]*[āīūṛṝḷṭḍṇśṣñṁḥĀĪŪ])"           # has a diacritic
+    r"(?![^\n]*(?i:TRANSLATION|PURPORT))"       # not a heading
+    r"(\S[^\n]{19,497}\S)"                       # the stripped line
+    r"[^\S\n]*$",                               # trailing spaces (stripped)
+    re.MULTILINE,
+)
+
+
+@lru_cache(maxsize=None)
+def _section_re(start_kw: str, end_kw: str | None) -> re.Pattern[str]:
+    """
+    The compiled pattern for one (start_kw, end_kw) pair.
+    Only a couple of pairs are ever used, so each is compiled once.
+    """
+    # Everything after start_kw up to end_kw (or end of string)
+    if end_kw:
+        pattern = rf"{start_kw}\s*(.*?)\s*{end_kw}"
+    else:
+        pattern = rf"{start_kw}\s*(.*)"
+    return re.compile(pattern, re.DOTALL | re.IGNORECASE)
+
+
 def _extract_section(text: str, start_kw: str, end_kw: str | None) -> str:
     """
     Extract the text between two keyword markers (case-insensitive).
@@ -125,13 +182,7 @@ def _extract_section(text: str, start_kw: str, end_kw: str | None) -> str:
       _extract_section(text, "TRANSLATION", "PURPORT")
       → "A sober person..."
     """
-    # Build a regex that finds everything after start_kw up to end_kw (or end of string)
-    if end_kw:
-        pattern = rf"{start_kw}\s*(.*?)\s*{end_kw}"
-    else:
-        pattern = rf"{start_kw}\s*(.*)"
-
-    match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+    match = _section_re(start_kw, end_kw).search(text)
     if match:
         return match.group(1).strip()
     return ""
@@ -146,22 +197,8 @@ def _extract_transliteration(text: str) -> str:
       - Contains characteristic diacritic characters (ā, ī, ū, ṛ, ṁ, ḥ, etc.)
       - Is on its own line or separated by newlines
     """
-    # Look for lines containing Sanskrit diacritic characters
-    diacritic_pattern = r"[āīūṛṝḷṭḍṇśṣñṁḥĀĪŪ]"
-
-    for line in text.split("\n"):
-        line = line.strip()
-        # A transliteration line: has diacritics, is reasonably long, not a heading
-        if (
-            re.search(diacritic_pattern, line)
-            and len(line) > 20
-            and len(line) < 500
-            and "TRANSLATION" not in line.upper()
-            and "PURPORT" not in line.upper()
-        ):
-            return line
-
-    return ""
+    match = _TRANSLIT_RE.search(text)
+    return match.group(1) if match else ""
 
 
 # ── Utility: load clean records ───────────────────────────────────────────────
@@ -172,10 +209,7 @@ def load_clean_records(clean_file: Path | None = None) -> list[dict]:
     Used by downstream stages (chunk, index, etc.).
     """
     clean_file = clean_file or (CLEAN_DIR / "noi_clean.jsonl")
-    records = []
-    with open(clean_file, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line:
-                records.append(json.loads(line))
-    return records
+    # One read() and one splitlines() (both in C) instead of a loop over lines
+    with open(clean_file, "rb") as f:
+        data = f.read()
+    return [orjson.loads(line) for line in data.splitlines() if line.strip()]
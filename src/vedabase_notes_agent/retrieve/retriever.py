@@ -18,9 +18,17 @@ Beginner tip — what is RAG?
     4. Claude writes notes citing [NOI 2 Translation], [NOI 8 Purport], etc.
 """
 
-from vedabase_notes_agent.config import TOP_K
+from functools import lru_cache
+
+import numpy as np
+
+from vedabase_notes_agent.config import SEMANTIC_CACHE_THRESHOLD, TOP_K
 from vedabase_notes_agent.index.embed import embed_query
-from vedabase_notes_agent.index.vector_store import query_collection
+from vedabase_notes_agent.index.vector_store import index_version, query_collection
+from vedabase_notes_agent.retrieve.semantic_cache import SemanticCache
+
+# Catches rephrasings of earlier queries ("tongue control" vs "control of the tongue")
+_semantic_cache = SemanticCache(threshold=SEMANTIC_CACHE_THRESHOLD, max_entries=512)
 
 
 def retrieve(query: str, top_k: int = TOP_K) -> list[dict]:
@@ -34,16 +42,67 @@ def retrieve(query: str, top_k: int = TOP_K) -> list[dict]:
     Returns:
         List of chunk dicts, ordered by relevance (most relevant first).
         Each dict has: text, chunk_id, verse_number, section, source_uri, distance
+
+    Results are cached per (query, top_k) — with extra spaces and line
+    breaks in the query ignored — so asking the same thing twice
+    skips both the embedding model and the DB search. A new query whose
+    embedding is nearly identical to an earlier one reuses that query's
+    results instead of searching again. Re-indexing — here or from another
+    process such as the CLI — invalidates both caches automatically.
+    """
+    hits = _cached_hits(normalize_query(query), top_k, index_version())
+    # Hand out copies so callers can't modify the cached results
+    return [dict(hit) for hit in hits]
+
+
+@lru_cache(maxsize=64)
+def _cached_hits(query: str, top_k: int, version: tuple) -> tuple[dict, ...]:
+    """
+    The uncached search. `version` is only part of the cache key — it
+    changes whenever the collection is re-indexed (see index_version()).
     """
     # Step 1: Convert query to an embedding vector
-    query_vec = embed_query(query)
+    query_vec = _query_embedding(query)
 
-    # Step 2: Search ChromaDB for similar vectors
-    hits = query_collection(query_vec, top_k=top_k)
+    # Step 2: Reuse the results of a near-identical earlier query, if any
+    key  = (top_k, version)
+    hits = _semantic_cache.lookup(query_vec, key)
+    if hits is not None:
+        return hits
 
+    # Step 3: Search ChromaDB for similar vectors
+    hits = tuple(query_collection(query_vec, top_k=top_k))
+    _semantic_cache.store(query_vec, key, hits)
     return hits
 
 
+def normalize_query(query: str) -> str:
+    """
+    Trim the query and collapse runs of whitespace to single spaces.
+
+    The tokenizer splits on whitespace anyway, so "tongue  control\n" and
+    "tongue control" embed identically — normalizing first lets them share
+    one cache entry. Case is left alone: it only matters to cased models,
+    and for those "Tongue" and "tongue" may embed differently.
+    """
+    return " ".join(query.split())
+
+
+@lru_cache(maxsize=512)
+def _query_embedding(query: str) -> np.ndarray:
+    """
+    Embed a query once and reuse it — different top_k values for the
+    same query share one pass through the model.
+
+    The vector stays a float32 numpy array all the way to ChromaDB and the
+    semantic cache (no round trip through 384 Python floats). It is marked
+    read-only because every caller shares the same cached array.
+    """
+    vec = np.asarray(embed_query(query), dtype=np.float32)
+    vec.setflags(write=False)
+    return vec
+
+
 def format_context(hits: list[dict], max_chars_per_chunk: int = 600) -> str:
     """
     Format retrieved chunks into a readable context block for Claude's prompt.
@@ -57,24 +116,27 @@ def format_context(hits: list[dict], max_chars_per_chunk: int = 600) -> str:
       Source: https://vedabase.io/en/library/noi/3/
       There are six kinds of aggressors...
     """
-    parts = []
-    for hit in hits:
-        verse = hit["verse_number"]
-        section = hit["section"]
-        uri = hit["source_uri"]
-        text = hit["text"][:max_chars_per_chunk]
-        if len(hit["text"]) > max_chars_per_chunk:
-            text += "..."
-
-        # Format the citation label clearly so Claude can reference it
-        label = f"NOI {verse}".upper() if verse != "preface" else "NOI Preface"
-        parts.append(
-            f"[{label} - {section}]\n"
-            f"Source: {uri}\n"
-            f"{text}"
-        )
-
-    return "\n\n---\n\n".join(parts)
+    return "\n\n---\n\n".join(_format_hit(hit, max_chars_per_chunk) for hit in hits)
+
+
+def _format_hit(hit: dict, max_chars: int) -> str:
+    """One hit as a labelled block: citation label, source URL, then text."""
+    text = hit["text"]
+    if len(text) > max_chars:
+        text = text[:max_chars] + "..."
+
+    # Format the citation label clearly so Claude can reference it
+    label = _context_label(hit["verse_number"])
+    return f"[{label} - {hit['section']}]\nSource: {hit['source_uri']}\n{text}"
+
+
+# There are only a dozen verse numbers and three sections, so labels are
+# built once per distinct value and then looked up.
+
+@lru_cache(maxsize=None)
+def _context_label(verse: str) -> str:
+    """'3' → 'NOI 3', 'preface' → 'NOI Preface'."""
+    return "NOI Preface" if verse == "preface" else f"NOI {verse}".upper()
 
 
 def citation_label(hit: dict) -> str:
@@ -82,6 +144,9 @@ def citation_label(hit: dict) -> str:
     Return the short citation string for a chunk, e.g. '[NOI 3 Purport]'.
     Used in notes and verification.
     """
-    verse   = hit["verse_number"].capitalize()
-    section = hit["section"].capitalize()
-    return f"[NOI {verse} {section}]"
+    return _citation_label(hit["verse_number"], hit["section"])
+
+
+@lru_cache(maxsize=None)
+def _citation_label(verse: str, section: str) -> str:
+    return f"[NOI {verse.capitalize()} {section.capitalize()}]"
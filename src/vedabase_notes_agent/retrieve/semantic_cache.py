@@ -0,0 +1,108 @@
+"""
+semantic_cache.py
+-----------------
+A small in-memory cache of search results, looked up by *meaning*.
+
+Beginner tip — what is a semantic cache?
+  A normal cache only helps when you ask exactly the same thing twice.
+  A semantic cache compares the query's embedding with the embeddings of
+  earlier queries. If an earlier query is almost identical in meaning
+  (cosine similarity above a threshold), its results are reused — no
+  vector DB search needed.
+
+  Comparing against every cached query is one matrix-vector product,
+  which numpy does in a single fast call.
+
+Beginner tip — int8 quantization:
+  Each cached embedding is stored as small integers (-127..127) plus one
+  float "scale" per vector, instead of 32-bit floats: 4× less memory,
+  and the similarity scores change only in the third decimal place.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    Least-recently-used cache of (query embedding → hits).
+
+    Entries are only matched against entries stored with the same `key`
+    (e.g. the same top_k and index version), so a hit is always a valid
+    answer for the current request.
+    """
+
+    def __init__(self, threshold: float = 0.97, max_entries: int = 512):
+        self.threshold   = threshold
+        self.max_entries = max_entries
+
+        # One int8-quantized unit-length row per slot, and its scale;
+        # allocated on first store()
+        self._vectors: np.ndarray | None = None
+        self._scales:  np.ndarray | None = None
+        # slot → (key, hits), oldest first (LRU order)
+        self._entries: OrderedDict[int, tuple[Hashable, tuple]] = OrderedDict()
+        # Streamlit sessions and background jobs search from different threads
+        self._lock = threading.Lock()
+
+    def lookup(self, query_vec: Sequence[float], key: Hashable) -> tuple | None:
+        """Return cached hits for a near-identical query, or None."""
+        with self._lock:
+            slots = [slot for slot, (k, _) in self._entries.items() if k == key]
+            if not slots:
+                return None
+
+            q, q_scale = _quantize(_unit(query_vec))
+            # Accumulate in int32 — an int8 dot product would overflow
+            dots = self._vectors[slots].astype(np.int32) @ q.astype(np.int32)
+            sims = dots * (self._scales[slots] * q_scale)
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                return None
+
+            slot = slots[best]
+            self._entries.move_to_end(slot)
+            return self._entries[slot][1]
+
+    def store(self, query_vec: Sequence[float], key: Hashable, hits: tuple) -> None:
+        """Remember hits for this query, evicting the oldest entry when full."""
+        vec, scale = _quantize(_unit(query_vec))
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != vec.shape[0]:
+                self._vectors = np.zeros((self.max_entries, vec.shape[0]), dtype=np.int8)
+                self._scales  = np.zeros(self.max_entries, dtype=np.float32)
+                self._entries.clear()
+
+            if len(self._entries) < self.max_entries:
+                slot = len(self._entries)
+            else:
+                slot, _ = self._entries.popitem(last=False)
+
+            self._vectors[slot] = vec
+            self._scales[slot]  = scale
+            self._entries[slot] = (key, hits)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _unit(vec: Sequence[float]) -> np.ndarray:
+    """Scale a vector to length 1 so a dot product equals cosine similarity."""
+    arr  = np.asarray(vec, dtype=np.float32)
+    norm = float(np.linalg.norm(arr))
+    return arr / norm if norm else arr
+
+
+def _quantize(vec: np.ndarray) -> tuple[np.ndarray, float]:
+    """Map a float vector to int8 values so that vec ≈ quantized * scale."""
+    peak = float(np.abs(vec).max())
+    if not peak:
+        return np.zeros(vec.shape, dtype=np.int8), 0.0
+    scale = peak / 127
+    return np.round(vec / scale).astype(np.int8), scale
@@ -0,0 +1,106 @@
+"""
+ui_browse.py
+------------
+Constants and text helpers for the Browse Book page.
+
+Beginner tip — why not define these in the page itself?
+  Streamlit executes a page script from top to bottom on every rerun, so
+  anything defined in the page (lists, lookup tables, even an lru_cache)
+  is rebuilt each time. A normal module like this one is imported once
+  per process, so its constants and caches survive across reruns.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+import unicodedata
+from functools import lru_cache
+
+# ── Page constants ────────────────────────────────────────────────────────────
+
+VERSE_OPTIONS = ("All", "Preface", *(f"Text {i}" for i in range(1, 12)))
+
+QUICK_SEARCHES = (
+    "controlling the senses",
+    "qualities of a spiritual master",
+    "chanting the holy name",
+    "Vrindavana dhama",
+    "offenses to be avoided",
+)
+
+# ── Diacritic-insensitive matching ────────────────────────────────────────────
+
+# The Sanskrit diacritics used in the book, mapped to plain letters.
+# One str.translate() pass handles nearly every word without Unicode decomposition.
+_DIA = str.maketrans({
+    "ā": "a", "Ā": "A", "ī": "i", "Ī": "I", "ū": "u", "Ū": "U", "ṛ": "r", "Ṛ": "R",
+    "ṅ": "n", "Ṅ": "N", "ñ": "n", "Ñ": "N", "ṭ": "t", "Ṭ": "T", "ḍ": "d", "Ḍ": "D",
+    "ṇ": "n", "Ṇ": "N", "ś": "s", "Ś": "S", "ṣ": "s", "Ṣ": "S", "ṁ": "m", "Ṁ": "M",
+    "ḥ": "h", "Ḥ": "H", "ṙ": "r", "Ṙ": "R",
+})
+
+# A "word" for highlighting — \w+ matches letters with diacritics too
+_WORD_RE = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=4096)
+def normalize(s: str) -> str:
+    """
+    Strip diacritics so plain English matches Sanskrit.
+    Cached because the same snippet words come up again and again across hits.
+    """
+    s = s.translate(_DIA)
+    if s.isascii():
+        return s
+    # Rare: a character not in the table — fall back to full decomposition
+    return unicodedata.normalize("NFD", s).encode("ascii", "ignore").decode()
+
+
+def highlight(text: str, qwords: set[str]) -> str:
+    """
+    Bold every word of `text` that contains one of the (normalized) query words.
+
+    One regex pass over the text; the spaces and line breaks between words
+    are kept exactly as they were. With no query words the text is
+    returned untouched, without scanning it.
+    """
+    if not qwords:
+        return text
+
+    def bold_match(m: re.Match) -> str:
+        word = m.group(0)
+        return f"**{word}**" if any(q in normalize(word.lower()) for q in qwords) else word
+
+    return _WORD_RE.sub(bold_match, text)
+
+
+# ── Result cards ──────────────────────────────────────────────────────────────
+
+_CARD_STYLE = (
+    "border:1px solid rgba(128,128,128,0.3);border-radius:0.5rem;"
+    "padding:0.6em 1em;margin-bottom:0.8em"
+)
+
+
+def hit_card(label: str, section: str, uri: str, snippet: str, score: float) -> str:
+    """
+    One search result as a bordered Markdown/HTML block.
+
+    Beginner tip — why not st.container + st.columns?
+      Every Streamlit element is a separate message to the browser. Building
+      each card as one string and drawing all cards with a single
+      st.markdown(..., unsafe_allow_html=True) sends one element instead of
+      six per result. The blank lines around the Markdown parts let bold
+      highlights render inside the <div>.
+    """
+    # Every field comes from the DB and the card is rendered as HTML,
+    # so escape < > & (and quotes inside the href attribute) in all of them
+    return (
+        f'<div style="{_CARD_STYLE}">\n\n'
+        f'**{html.escape(label, quote=False)}** — *{html.escape(section, quote=False)}* '
+        f'<a href="{html.escape(uri)}" target="_blank" style="float:right">Read on vedabase.io ↗</a>\n\n'
+        f"{html.escape(snippet, quote=False)}\n\n"
+        f'<span style="opacity:0.6;font-size:0.85em">Relevance: {score:.0%}</span>\n\n'
+        f"</div>"
+    )
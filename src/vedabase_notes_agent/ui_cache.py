@@ -0,0 +1,101 @@
+"""
+ui_cache.py
+-----------
+Shared Streamlit caches used by the pages.
+
+Beginner tip — why cache?
+  Streamlit re-runs the whole page script on every click, slider move,
+  or keystroke. Anything expensive at the top of a page (like opening
+  the vector database) would run again each time. @st.cache_data keeps
+  the result in memory so repeat reruns read it instantly.
+
+  A short ttl (time-to-live) means the value refreshes on its own after
+  a few seconds, and .clear() forces a refresh right after a pipeline
+  step changes the data.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import streamlit as st
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_collection_size() -> int:
+    """
+    Return the number of chunks in the vector DB, cached for 30 seconds.
+
+    Call cached_collection_size.clear() after indexing so the new count
+    shows up straight away.
+    """
+    from vedabase_notes_agent.index.vector_store import collection_size
+    return collection_size()
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def cached_retrieve(query: str, top_k: int, index_version: tuple) -> list[dict]:
+    """
+    Search results for (query, top_k), cached across reruns.
+
+    Pass retriever.normalize_query(query) so differences in spacing share
+    one entry. Case is kept — the embedding model may be case-sensitive.
+    Pass vector_store.index_version() too: it changes whenever the index
+    is rebuilt (even from the CLI), so old results are never served.
+    """
+    from vedabase_notes_agent.retrieve.retriever import retrieve
+    return retrieve(query, top_k=top_k)
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def pipeline_status() -> tuple[bool, bool, bool]:
+    """
+    Return (raw_ok, clean_ok, chunks_ok) for the NOI pipeline outputs.
+
+    Each data folder is listed once with os.scandir instead of stat-ing
+    every file separately. Call pipeline_status.clear() after a step
+    finishes so the page shows the new state.
+    """
+    from vedabase_notes_agent.config import CHUNKS_DIR, CLEAN_DIR, RAW_DIR
+    return (
+        "noi_raw.json"     in file_names(RAW_DIR / "noi"),
+        "noi_clean.jsonl"  in file_names(CLEAN_DIR),
+        "noi_chunks.jsonl" in file_names(CHUNKS_DIR),
+    )
+
+
+@lru_cache(maxsize=32)
+def status_markdown(status: tuple[bool, bool, bool], db_ok: bool, db_size: int) -> str:
+    """
+    The sidebar "System Status" checklist for a pipeline_status() tuple
+    and the vector DB state. Only rebuilt when one of the inputs changes.
+    """
+    raw_ok, clean_ok, chunks_ok = status
+    return (
+        f"{'✅' if raw_ok    else '⬜'} Raw data\n\n"
+        f"{'✅' if clean_ok  else '⬜'} Parsed records\n\n"
+        f"{'✅' if chunks_ok else '⬜'} Chunks\n\n"
+        f"{'✅' if db_ok     else '⬜'} Vector DB ({db_size} chunks)"
+    )
+
+
+def file_names(folder: Path) -> set[str]:
+    """Names of the entries in a folder (empty if it doesn't exist yet)."""
+    try:
+        with os.scandir(folder) as entries:
+            return {e.name for e in entries}
+    except FileNotFoundError:
+        return set()
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def read_note(path_str: str, mtime: float) -> str:
+    """
+    Read a saved notes file, cached per (path, mtime).
+
+    Pass the file's current mtime so an edited or regenerated file is
+    read again instead of served stale from the cache.
+    """
+    return Path(path_str).read_text(encoding="utf-8")
@@ -8,8 +8,14 @@ Import and call show_jobs_sidebar() at the bottom of any page's sidebar section.
 
 from __future__ import annotations
 
+import os
+from pathlib import Path
+
 import streamlit as st
 from vedabase_notes_agent.jobs import get_all_jobs, clear_job
+from vedabase_notes_agent.ui_cache import (
+    cached_collection_size, cached_retrieve, pipeline_status, read_note
+)
 
 
 def show_jobs_sidebar():
@@ -19,16 +25,43 @@ def show_jobs_sidebar():
     - Shows running jobs with a spinner
     - Shows completed jobs with a link to the notes
     - Shows failed jobs with the error
-    - Auto-refreshes every 5 seconds while a job is running
+    - Refreshes itself every 2 seconds without rerunning the whole page
+    """
+    # Fragments draw into their own container, so open the sidebar here
+    # and let the fragment write into it.
+    with st.sidebar:
+        _jobs_panel()
+
+
+@st.fragment(run_every=2.0)
+def _jobs_panel():
+    """
+    The sidebar job list, as a Streamlit fragment.
+
+    Beginner tip — what is a fragment?
+      Normally any change reruns the entire page script. A fragment is a
+      piece of the page that can rerun on its own. run_every=2.0 makes
+      just this panel poll the job files every 2 seconds, while the rest
+      of the page (DB checks, file lists, forms) stays untouched.
     """
     jobs = get_all_jobs()
+
+    # When a job finishes, rerun the whole page once so page content
+    # (e.g. the Recent Jobs list, pipeline status) picks up the new result too.
+    running = {j.get("job_id") for j in jobs if j.get("status") == "running"}
+    previous = st.session_state.get("_running_job_ids", running)
+    st.session_state["_running_job_ids"] = running
+    if previous - running:
+        pipeline_status.clear()
+        cached_collection_size.clear()
+        cached_retrieve.clear()
+        st.rerun()
+
     if not jobs:
         return  # nothing to show
 
-    st.sidebar.divider()
-    st.sidebar.markdown("### 🔄 Background Jobs")
-
-    any_running = False
+    st.divider()
+    st.markdown("### 🔄 Background Jobs")
 
     for job in jobs[:5]:  # show latest 5 jobs
         status     = job.get("status", "unknown")
@@ -36,22 +69,25 @@ def show_jobs_sidebar():
         job_id     = job.get("job_id", "")
         short_topic = topic[:30] + ("..." if len(topic) > 30 else "")
 
-        if status == "running":
-            any_running = True
-            st.sidebar.markdown(f"⏳ **Generating...**\n\n*{short_topic}*")
+        if status == "running" and job.get("kind") == "pipeline":
+            st.markdown(f"⏳ **Running pipeline...**\n\n*{job.get('step') or 'Starting...'}*")
+
+        elif status == "running":
+            st.markdown(f"⏳ **Generating...**\n\n*{short_topic}*")
+            if job.get("step"):
+                st.caption(job["step"])
 
         elif status == "done":
             result_path = job.get("result_path", "")
-            col1, col2 = st.sidebar.columns([3, 1])
+            col1, col2 = st.columns([3, 1])
             col1.markdown(f"✅ **Done**\n\n*{short_topic}*")
             if col2.button("✕", key=f"sb_clear_{job_id}", help="Dismiss"):
                 clear_job(job_id)
                 st.rerun()
             if result_path:
                 try:
-                    from pathlib import Path
-                    content = Path(result_path).read_text(encoding="utf-8")
-                    st.sidebar.download_button(
+                    content = read_note(result_path, os.path.getmtime(result_path))
+                    st.download_button(
                         "⬇ Download",
                         data=content,
                         file_name=Path(result_path).name,
@@ -63,17 +99,13 @@ def show_jobs_sidebar():
                     pass
 
         elif status == "error":
-            col1, col2 = st.sidebar.columns([3, 1])
+            col1, col2 = st.columns([3, 1])
             col1.markdown(f"❌ **Failed**\n\n*{short_topic}*")
             if col2.button("✕", key=f"sb_clear_err_{job_id}", help="Dismiss"):
                 clear_job(job_id)
                 st.rerun()
-            with st.sidebar.expander("See error"):
+            with st.expander("See error"):
                 st.error(job.get("error", "Unknown error"))
 
-    # Auto-refresh while a job is running so status updates appear
-    if any_running:
-        st.sidebar.caption("Refreshing every 5s...")
-        import time
-        time.sleep(5)
-        st.rerun()
+    if running:
+        st.caption("Refreshing every 2s...")
@@ -0,0 +1,43 @@
+"""
+test_browse.py — Tests for the Browse Book text helpers.
+Run with: python -m pytest tests/
+"""
+
+from vedabase_notes_agent.ui_browse import VERSE_OPTIONS, highlight, hit_card, normalize
+
+
+def test_normalize_strips_diacritics():
+    assert normalize("Gosvāmī") == "Gosvami"
+    assert normalize("kṛṣṇa") == "krsna"
+
+
+def test_highlight_matches_without_diacritics():
+    result = highlight("A Gosvāmī controls the senses.", {"gosvami"})
+    assert result == "A **Gosvāmī** controls the senses."
+
+
+def test_highlight_keeps_line_breaks():
+    assert highlight("first line\n\nsecond line", {"second"}) == "first line\n\n**second** line"
+
+
+def test_verse_options_cover_all_texts():
+    assert VERSE_OPTIONS[:2] == ("All", "Preface")
+    assert VERSE_OPTIONS[-1] == "Text 11"
+
+
+def test_highlight_without_query_words_returns_text():
+    assert highlight("short words only", set()) == "short words only"
+
+
+def test_hit_card_escapes_snippet_html():
+    card = hit_card("NOI Text 1", "Purport", "https://vedabase.io/en/library/noi/1/",
+                    "**tongue** <b>", 0.8)
+    assert "**tongue** &lt;b&gt;" in card
+    assert "Relevance: 80%" in card
+
+
+def test_hit_card_escapes_every_db_field():
+    card = hit_card("NOI <i>1</i>", "<script>x</script>", 'https://x/"><img>', "ok", 0.5)
+    assert "<i>" not in card and "<script>" not in card and "<img>" not in card
+    assert "NOI &lt;i&gt;1&lt;/i&gt;" in card
+    assert 'href="https://x/&quot;&gt;&lt;img&gt;"' in card
@@ -80,3 +80,12 @@ def test_no_empty_chunks():
     chunks = _chunk_record(SAMPLE_RECORD)
     for chunk in chunks:
         assert len(chunk["text"].strip()) > 10, "Chunk text should not be empty"
+
+
+def test_purport_split_on_word_boundaries():
+    chunks = _chunk_record(SAMPLE_RECORD)
+    words = set(SAMPLE_RECORD["purport"].split())
+    for chunk in chunks:
+        if chunk["section"] == "purport":
+            first, *_, last = chunk["text"].split()
+            assert first in words and last in words
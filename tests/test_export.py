@@ -0,0 +1,14 @@
+"""
+test_export.py — Tests for the markdown exporter.
+Run with: python -m pytest tests/
+"""
+
+from datetime import date
+
+from vedabase_notes_agent.export.export_markdown import export_notes
+
+
+def test_export_slugifies_topic(tmp_path):
+    path = export_notes("# Notes", "Controlling the Senses — Gosvāmī's path!", tmp_path)
+    assert path.name == f"notes_controlling_the_senses_gosvāmīs_path_{date.today().isoformat()}.md"
+    assert path.read_text(encoding="utf-8") == "# Notes"
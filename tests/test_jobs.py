@@ -0,0 +1,23 @@
+"""
+test_jobs.py — Tests for the background job records.
+Run with: python -m pytest tests/
+"""
+
+import orjson
+
+from vedabase_notes_agent import jobs
+
+
+def test_job_left_running_by_a_restart_is_not_running(tmp_path, monkeypatch):
+    monkeypatch.setattr(jobs, "JOBS_DIR", tmp_path)
+    monkeypatch.setattr(jobs, "INDEX_FILE", tmp_path / "index.json")
+    monkeypatch.setattr(jobs, "_live_jobs", {})  # no job threads in this process
+
+    job = {"job_id": "abc12345", "kind": "pipeline", "status": "running", "created_at": "1"}
+    (tmp_path / "index.json").write_bytes(orjson.dumps({"abc12345": job}))
+
+    assert not jobs.has_running_jobs(kind="pipeline")
+
+    # The interruption is saved, not just hidden
+    saved = orjson.loads((tmp_path / "index.json").read_bytes())["abc12345"]
+    assert saved["status"] == "error"
@@ -4,7 +4,9 @@ Run with: python -m pytest tests/
 """
 
 import pytest
-from vedabase_notes_agent.parse.parse_noi import _parse_page, _extract_section
+from vedabase_notes_agent.parse.parse_noi import (
+    _parse_page, _extract_section, _extract_transliteration
+)
 
 
 # ── Sample data ───────────────────────────────────────────────────────────────
@@ -37,42 +39,56 @@ SAMPLE_PREFACE_PAGE = {
 }
 
 
-# ── Tests ─────────────────────────────────────────────────────────────────────
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+# The sample pages never change, so each is parsed once and shared by every
+# test in this file (tests only read the records, never modify them).
 
-def test_parse_verse_has_required_fields():
-    record = _parse_page(SAMPLE_RAW_PAGE)
-    assert record is not None
-    for field in ["id", "book", "verse_number", "translation", "purport", "source_uri"]:
-        assert field in record, f"Missing field: {field}"
+@pytest.fixture(scope="module")
+def parsed_sample():
+    return _parse_page(SAMPLE_RAW_PAGE)
 
 
-def test_parse_verse_number():
-    record = _parse_page(SAMPLE_RAW_PAGE)
-    assert record["verse_number"] == "1"
+@pytest.fixture(scope="module")
+def parsed_preface():
+    return _parse_page(SAMPLE_PREFACE_PAGE)
 
 
-def test_parse_book_name():
-    record = _parse_page(SAMPLE_RAW_PAGE)
-    assert record["book"] == "NOI"
+# ── Tests ─────────────────────────────────────────────────────────────────────
 
+REQUIRED_FIELDS = ["id", "book", "verse_number", "translation", "purport", "source_uri"]
 
-def test_parse_translation_extracted():
-    record = _parse_page(SAMPLE_RAW_PAGE)
-    assert "sober person" in record["translation"]
+# (what is checked, a check that must hold for the parsed SAMPLE_RAW_PAGE)
+SAMPLE_CHECKS = [
+    ("required_fields", lambda r: all(field in r for field in REQUIRED_FIELDS)),
+    ("verse_number",    lambda r: r["verse_number"] == "1"),
+    ("book",            lambda r: r["book"] == "NOI"),
+    ("translation",     lambda r: "sober person" in r["translation"]),
+    ("purport",         lambda r: "Gosvāmī" in r["purport"] or "gosvami" in r["purport"].lower()),
+]
 
 
-def test_parse_purport_extracted():
-    record = _parse_page(SAMPLE_RAW_PAGE)
-    assert "Gosvāmī" in record["purport"] or "gosvami" in record["purport"].lower()
+@pytest.mark.parametrize(
+    "name, check", SAMPLE_CHECKS, ids=[name for name, _ in SAMPLE_CHECKS]
+)
+def test_parse_verse_fields(parsed_sample, name, check):
+    assert parsed_sample is not None
+    assert check(parsed_sample), f"Check failed: {name}"
 
 
-def test_parse_preface():
-    record = _parse_page(SAMPLE_PREFACE_PAGE)
+def test_parse_preface(parsed_preface):
+    record = parsed_preface
     assert record is not None
     assert record["verse_number"] == "preface"
     assert len(record["purport"]) > 0
 
 
+def test_parse_preface_keeps_ascii_text_ascii(parsed_preface):
+    # Pure-ASCII input must come out pure ASCII: CPython then stores the
+    # string one byte per character, and regexes over it take the fast path.
+    assert SAMPLE_PREFACE_PAGE["text"].isascii()
+    assert parsed_preface["purport"].isascii()
+
+
 def test_extract_section_basic():
     text = "Some text TRANSLATION This is the translation. PURPORT This is the purport."
     result = _extract_section(text, "TRANSLATION", "PURPORT")
@@ -88,3 +104,18 @@ def test_extract_section_to_end():
 def test_empty_page_returns_none():
     result = _parse_page({"id": "1", "title": "T", "url": "http://x.com", "text": ""})
     assert result is None
+
+
+def test_extract_transliteration_first_matching_line():
+    text = (
+        "Text 1\n"
+        "  vāco vegaṁ manasaḥ krodha-vegaṁ jihvā-vegam  \n"
+        "udaropastha-vegaṁ viṣaheta dhīraḥ\n"
+    )
+    assert _extract_transliteration(text) == "vāco vegaṁ manasaḥ krodha-vegaṁ jihvā-vegam"
+
+
+def test_extract_transliteration_skips_headings_and_short_lines():
+    text = "ṁḥ\nPurport: vāco vegaṁ manasaḥ krodha-vegaṁ\nsarvām apīmāṁ pṛthivīṁ sa śiṣyāt"
+    assert _extract_transliteration(text) == "sarvām apīmāṁ pṛthivīṁ sa śiṣyāt"
+    assert _extract_transliteration("No diacritics on this fairly long line") == ""
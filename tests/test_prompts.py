@@ -0,0 +1,27 @@
+"""
+test_prompts.py — Tests for the compiled prompt templates.
+Run with: python -m pytest tests/
+"""
+
+from vedabase_notes_agent.agent import prompts
+
+
+PARAMS = {
+    "topic":       "controlling the tongue",
+    "audience":    "new students",
+    "duration":    45,
+    "style":       "class",
+    "outline":     "1. Introduction",
+    "excerpt_max": 300,
+}
+
+
+def test_compiled_templates_match_str_format():
+    assert prompts.plan(**PARAMS)  == prompts.PLAN_PROMPT.format(**PARAMS)
+    assert prompts.draft(**PARAMS) == prompts.DRAFT_PROMPT.format(**PARAMS)
+
+
+def test_compiled_verify_keeps_json_braces():
+    result = prompts.verify(excerpt_max=300, notes="Some notes")
+    assert result == prompts.VERIFY_PROMPT.format(excerpt_max=300, notes="Some notes")
+    assert '"pass": true/false' in result
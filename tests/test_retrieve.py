@@ -3,10 +3,18 @@ test_retrieve.py — Tests for the retriever and formatting utilities.
 Run with: python -m pytest tests/
 """
 
-from vedabase_notes_agent.retrieve.retriever import format_context, citation_label
+from types import MappingProxyType
 
+import pytest
 
-SAMPLE_HITS = [
+from vedabase_notes_agent.retrieve.retriever import (
+    citation_label, format_context, normalize_query
+)
+
+
+# Read-only views, so no test can change the samples another test sees;
+# tests that need a variant copy one with {**SAMPLE_HITS[0], ...}.
+SAMPLE_HITS = tuple(MappingProxyType(hit) for hit in [
     {
         "text":         "A sober person can tolerate the urge to speak.",
         "chunk_id":     "NOI-1-translation",
@@ -23,29 +31,37 @@ SAMPLE_HITS = [
         "source_uri":   "https://vedabase.io/en/library/noi/1/",
         "distance":     0.25,
     },
-]
+])
+
+# A hit whose text is far longer than max_chars_per_chunk
+LONG_HIT = {**SAMPLE_HITS[0], "text": "x" * 2000}
 
 
-def test_format_context_returns_string():
-    result = format_context(SAMPLE_HITS)
+@pytest.fixture(scope="module")
+def formatted_context():
+    """format_context(SAMPLE_HITS), built once for the tests that read it."""
+    return format_context(SAMPLE_HITS)
+
+
+def test_format_context_returns_string(formatted_context):
+    result = formatted_context
     assert isinstance(result, str)
     assert len(result) > 0
 
 
-def test_format_context_includes_labels():
-    result = format_context(SAMPLE_HITS)
+def test_format_context_includes_labels(formatted_context):
+    result = formatted_context
     assert "NOI" in result
     assert "translation" in result.lower()
 
 
-def test_format_context_includes_source_uri():
-    result = format_context(SAMPLE_HITS)
+def test_format_context_includes_source_uri(formatted_context):
+    result = formatted_context
     assert "vedabase.io" in result
 
 
 def test_format_context_truncates_long_text():
-    long_hit = {**SAMPLE_HITS[0], "text": "x" * 2000}
-    result = format_context([long_hit], max_chars_per_chunk=600)
+    result = format_context([LONG_HIT], max_chars_per_chunk=600)
     assert "..." in result
 
 
@@ -65,3 +81,27 @@ def test_citation_label_preface():
 def test_format_context_empty_list():
     result = format_context([])
     assert result == ""
+
+
+def test_semantic_cache_matches_near_identical_query():
+    from vedabase_notes_agent.retrieve.semantic_cache import SemanticCache
+    cache = SemanticCache(threshold=0.97, max_entries=2)
+    cache.store([1.0, 0.0], key=8, hits=("a",))
+    assert cache.lookup([0.99, 0.01], key=8) == ("a",)
+    assert cache.lookup([0.0, 1.0], key=8) is None
+    assert cache.lookup([1.0, 0.0], key=5) is None   # different top_k
+
+
+def test_semantic_cache_evicts_oldest_entry():
+    from vedabase_notes_agent.retrieve.semantic_cache import SemanticCache
+    cache = SemanticCache(max_entries=2)
+    cache.store([1.0, 0.0, 0.0], key=8, hits=("a",))
+    cache.store([0.0, 1.0, 0.0], key=8, hits=("b",))
+    cache.store([0.0, 0.0, 1.0], key=8, hits=("c",))
+    assert cache.lookup([1.0, 0.0, 0.0], key=8) is None
+    assert cache.lookup([0.0, 0.0, 1.0], key=8) == ("c",)
+
+
+def test_normalize_query_collapses_whitespace():
+    assert normalize_query("  controlling   the\ntongue ") == "controlling the tongue"
+    assert normalize_query("Tongue") == "Tongue"  # case is preserved
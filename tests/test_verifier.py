@@ -0,0 +1,50 @@
+"""
+test_verifier.py — Tests for the rule-based notes verifier.
+Run with: python -m pytest tests/
+"""
+
+from vedabase_notes_agent.agent.verifier import REQUIRED_SECTIONS, rule_check
+
+
+def test_rule_check_counts_citations():
+    notes = "\n".join(REQUIRED_SECTIONS) + (
+        "\nPoint one [NOI 1 Translation]. Point two [NOI 3 Purport]. See [NOI Preface]."
+    )
+    result = rule_check(notes)
+    assert result["citation_count"] == 3
+    assert result["sections_ok"]
+    assert result["pass"]
+
+
+def test_rule_check_flags_missing_sections_and_long_excerpts():
+    notes = '## Outline\n> "' + "x" * 1000 + '" — [NOI 1 Purport]'
+    result = rule_check(notes)
+    assert not result["sections_ok"]
+    assert not result["excerpts_ok"]
+    assert not result["pass"]
+
+
+def test_citation_re_needs_a_section_except_for_preface():
+    from vedabase_notes_agent.agent.verifier import CITATION_RE
+    text = "[NOI 1 Translation] [noi preface] [NOI 3] [BG 2.13 Purport]"
+    assert CITATION_RE.findall(text) == ["[NOI 1 Translation]", "[noi preface]"]
+
+
+def test_rule_check_accepts_headings_with_subtitles():
+    notes = "\n".join(REQUIRED_SECTIONS).replace(
+        "## Appendix", "## Appendix: Key NOI Passages"
+    )
+    assert rule_check(notes)["sections_ok"]
+
+
+def test_unclosed_excerpt_does_not_hide_citations():
+    # Opened with a straight quote, closed with a curly one — the excerpt
+    # regex runs on to the next " but the citations must still be counted
+    notes = "\n".join(REQUIRED_SECTIONS) + (
+        '\n> "Whatever you do” — [NOI 1 Translation]'
+        "\n> Point two [NOI 3 Purport]. See [NOI Preface]."
+        '\nA later "quote".'
+    )
+    result = rule_check(notes)
+    assert result["citation_count"] == 3
+    assert result["citations_ok"]